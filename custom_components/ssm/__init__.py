@@ -5,19 +5,51 @@ from __future__ import annotations
 import logging
 from typing import Final
 
-from homeassistant.config_entries import ConfigEntry  # type: ignore
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState  # type: ignore
 from homeassistant.const import Platform  # type: ignore
 from homeassistant.core import HomeAssistant  # type: ignore
+from homeassistant.helpers import config_validation as cv  # type: ignore
+from homeassistant.helpers.start import async_at_started  # type: ignore
+from homeassistant.helpers.typing import ConfigType  # type: ignore
+
+from .const import CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS, DOMAIN
+from .coordinator import async_get_coordinators
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: Final[list[Platform]] = [Platform.SENSOR]
+PLATFORMS: Final[list[Platform]] = [Platform.BINARY_SENSOR, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up the SSM services and resume interrupted backfills."""
+    async_setup_services(hass)
+
+    async def _async_resume_backfills(_hass: HomeAssistant) -> None:
+        await async_get_coordinators(hass).backfill.async_resume()
+
+    async_at_started(hass, _async_resume_backfills)
+
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SSM from a config entry."""
     _LOGGER.debug("Setting up SSM integration with entry_id: %s", entry.entry_id)
 
+    coordinators = async_get_coordinators(hass)
+    await coordinators.cache.async_load()
+    await coordinators.async_set_concurrency_limit(
+        entry.entry_id,
+        int(
+            entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            )
+        ),
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -27,4 +59,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading SSM integration with entry_id: %s", entry.entry_id)
 
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+    if unload_ok:
+        async_get_coordinators(hass).async_release(entry.entry_id)
+
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Hand the diagnostic entities over when their entry is removed."""
+    coordinators = async_get_coordinators(hass)
+    if coordinators.diagnostics_entry_id is not None:
+        return
+
+    # A reloading entry claims them again on setup; a removed one does not,
+    # so reload another entry to take them over.
+    other_entry = next(
+        (
+            other
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+            and other.state is ConfigEntryState.LOADED
+        ),
+        None,
+    )
+    if other_entry is not None:
+        hass.config_entries.async_schedule_reload(other_entry.entry_id)
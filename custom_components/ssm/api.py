@@ -0,0 +1,694 @@
+"""HTTP client for the Swedish Radiation Safety Authority APIs."""
+
+# pylint: disable=C0301, E0401, R0902, R0903, R0914
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import math
+import random
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Coroutine, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, hdrs  # type: ignore
+from homeassistant.helpers.json import json_dumps_sorted  # type: ignore
+from homeassistant.util.json import json_loads  # type: ignore
+
+from .const import (
+    API_CIRCUIT_COOLDOWN,
+    API_CIRCUIT_THRESHOLD,
+    API_MAX_ATTEMPTS,
+    API_REQUEST_TIMEOUT,
+    API_RETRY_BASE_DELAY,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    RADIATION_HISTORY_URL,
+    SUN_TIME_CALCULATE_URL,
+    SUN_TIME_CALCULATE_WITH_INDEX_URL,
+    UV_INDEX_URL,
+)
+from .tracing import record_request
+from .util import to_number
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SSMCircuitOpenError(ClientError):
+    """Error to indicate requests to a failing SSM host are paused."""
+
+
+SafeTimes = dict[str, int | float | None]
+
+ENDPOINT_RADIATION = "radiation"
+ENDPOINT_UV_INDEX = "uv_index"
+ENDPOINT_SUN_TIME = "sun_time"
+ENDPOINT_SUN_TIME_INDEX = "sun_time_index"
+ENDPOINTS = (
+    ENDPOINT_RADIATION,
+    ENDPOINT_UV_INDEX,
+    ENDPOINT_SUN_TIME,
+    ENDPOINT_SUN_TIME_INDEX,
+)
+
+# Longest prefix first, as the sun-time URLs share a prefix.
+_ENDPOINT_PREFIXES = sorted(
+    (
+        (RADIATION_HISTORY_URL, ENDPOINT_RADIATION),
+        (UV_INDEX_URL.split("{", 1)[0], ENDPOINT_UV_INDEX),
+        (SUN_TIME_CALCULATE_URL, ENDPOINT_SUN_TIME),
+        (SUN_TIME_CALCULATE_WITH_INDEX_URL, ENDPOINT_SUN_TIME_INDEX),
+    ),
+    key=lambda item: len(item[0]),
+    reverse=True,
+)
+
+# Upper bounds in seconds of the request latency histogram buckets; slower
+# requests fall into a final overflow bucket.
+_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def endpoint_name(url: str) -> str:
+    """Return the metrics name of the endpoint a URL belongs to."""
+    for prefix, name in _ENDPOINT_PREFIXES:
+        if url.startswith(prefix):
+            return name
+
+    return urlsplit(url).path
+
+
+@dataclass(slots=True)
+class ApiResponse:
+    """Decoded response from an SSM endpoint."""
+
+    status: int
+    data: Any = None
+    not_modified: bool = False
+
+
+@dataclass(slots=True)
+class RadiationData:
+    """Radiation values for a station, in μSv/h as returned by the API."""
+
+    latest: float
+    minimum: float
+    maximum: float
+    average: float
+    last_updated: str
+    rolling: dict[str, dict[str, Any]] = field(default_factory=dict)
+    anomaly: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class UVIndexData:
+    """Parsed UV index forecast for a location."""
+
+    hourly_uv_index: tuple[int | float | None, ...]
+    hourly_forecast: tuple[dict[str, Any], ...]
+    max_uv_today: int | float
+    max_uv_time: str | None
+    max_uv_tomorrow: int | float | None
+    date: str
+    last_updated: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UVIndexData:
+        """Rebuild a forecast from its JSON form, where tuples became lists."""
+        return cls(
+            **{
+                **data,
+                "hourly_uv_index": tuple(data["hourly_uv_index"]),
+                "hourly_forecast": tuple(data["hourly_forecast"]),
+            }
+        )
+
+    def uv_index_at(self, hour: int) -> int | float | None:
+        """Return the forecast UV index for an hour of today."""
+        if hour >= len(self.hourly_uv_index):
+            return None
+
+        return self.hourly_uv_index[hour]
+
+
+def parse_radiation_samples(values: list[Any]) -> list[tuple[int, float]]:
+    """Return (Unix milliseconds, μSv/h) pairs with numeric values only."""
+    samples: list[tuple[int, float]] = []
+    ordered = True
+    last_timestamp = -1
+
+    for item in values:
+        if not isinstance(item, (list, tuple)) or len(item) < 2:
+            continue
+
+        timestamp = to_number(item[0])
+        value = to_number(item[1])
+        if timestamp is None or value is None:
+            continue
+
+        timestamp = int(timestamp)
+        if timestamp < last_timestamp:
+            ordered = False
+        last_timestamp = timestamp
+        samples.append((timestamp, float(value)))
+
+    # The API returns samples in time order; only sort if it did not.
+    if not ordered:
+        samples.sort()
+    return samples
+
+
+def parse_uv_index(data: dict[str, Any], day: str) -> UVIndexData:
+    """Parse a UV index API response in one pass over the hourly values.
+
+    Raise ValueError, KeyError or TypeError if the response is unusable.
+    """
+    dates = data["response"]["location"]["date"]
+    if not dates:
+        raise ValueError(f"No UV date data received from SSM UV Index API: {data}")
+
+    today_data = dates[0]
+    max_uv_today = to_number(today_data["maxUvIndex"])
+    if max_uv_today is None:
+        raise ValueError(f"Invalid UV values received from SSM UV Index API: {data}")
+
+    hourly_uv_index: list[int | float | None] = []
+    hourly_forecast: list[dict[str, Any]] = []
+    for hour, value in enumerate(today_data["hourlyUvIndex"]):
+        uv_index = to_number(value)
+        hourly_uv_index.append(uv_index)
+        hourly_forecast.append({"time": f"{hour:02d}:00", "uv_index": uv_index})
+
+    max_uv_time = today_data.get("maxUvIndexTime")
+    max_time_formatted: str | None = None
+    if max_uv_time:
+        max_time_formatted = datetime.strptime(
+            max_uv_time, "%Y-%m-%dT%H:%M:%S"
+        ).strftime("%H:%M")
+
+    max_uv_tomorrow: int | float | None = None
+    if len(dates) > 1:
+        max_uv_tomorrow = to_number(dates[1].get("maxUvIndex"))
+
+    return UVIndexData(
+        hourly_uv_index=tuple(hourly_uv_index),
+        hourly_forecast=tuple(hourly_forecast),
+        max_uv_today=max_uv_today,
+        max_uv_time=max_time_formatted,
+        max_uv_tomorrow=max_uv_tomorrow,
+        date=day,
+        last_updated=datetime.now(UTC).isoformat(),
+    )
+
+
+def parse_safe_times(results: list[dict[str, Any]]) -> SafeTimes:
+    """Parse safe times from the SSM sun time API response."""
+    safe_times: SafeTimes = {
+        "direkt solljus": None,
+        "lite skugga": None,
+        "mycket skugga": None,
+    }
+
+    for item in results:
+        desc = item.get("shadowDescription", "").lower()
+
+        for key in safe_times:
+            if key in desc:
+                safe_times[key] = to_number(item.get("safeTime"))
+
+    return safe_times
+
+
+class EndpointMetrics:
+    """Request counters and a latency histogram for one endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.coalesced = 0
+        self.bytes_received = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.statuses: Counter[int] = Counter()
+        self.strategies: Counter[str] = Counter()
+        self._buckets = [0] * (len(_LATENCY_BUCKETS) + 1)
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    def _record_latency(self, latency: float) -> None:
+        """Add a request duration in seconds to the histogram."""
+        self._buckets[bisect.bisect_left(_LATENCY_BUCKETS, latency)] += 1
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+
+    def record_response(self, latency: float, status: int, size: int) -> None:
+        """Record a completed HTTP exchange."""
+        self.requests += 1
+        self.statuses[status] += 1
+        self.bytes_received += size
+        self._record_latency(latency)
+
+    def record_error(self, latency: float) -> None:
+        """Record a request that failed without a response."""
+        self.requests += 1
+        self.errors += 1
+        self._record_latency(latency)
+
+    def latency_percentile(self, percent: float) -> float | None:
+        """Return the bucket upper bound below which a percentage of requests fall."""
+        if not self.requests:
+            return None
+
+        rank = max(math.ceil(self.requests * percent / 100), 1)
+        seen = 0
+        for index, count in enumerate(self._buckets):
+            seen += count
+            if seen >= rank:
+                break
+
+        if index < len(_LATENCY_BUCKETS):
+            return _LATENCY_BUCKETS[index]
+
+        return self._max_latency
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics, with latencies in milliseconds."""
+        lookups = self.cache_hits + self.cache_misses
+        strategies = sum(self.strategies.values())
+
+        def milliseconds(seconds: float | None) -> int | None:
+            return round(seconds * 1000) if seconds is not None else None
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "coalesced": self.coalesced,
+            "statuses": {
+                str(status): count for status, count in sorted(self.statuses.items())
+            },
+            "bytes_received": self.bytes_received,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": round(self.cache_hits / lookups, 3) if lookups else None,
+            "avg_latency": milliseconds(
+                self._total_latency / self.requests if self.requests else None
+            ),
+            "p50_latency": milliseconds(self.latency_percentile(50)),
+            "p95_latency": milliseconds(self.latency_percentile(95)),
+            "p99_latency": milliseconds(self.latency_percentile(99)),
+            "max_latency": milliseconds(self._max_latency if self.requests else None),
+            "latency_buckets": {
+                **{
+                    f"le_{round(bound * 1000)}ms": count
+                    for bound, count in zip(
+                        _LATENCY_BUCKETS, self._buckets, strict=False
+                    )
+                },
+                "overflow": self._buckets[-1],
+            },
+            "strategies": dict(self.strategies),
+            "fallback_ratio": (
+                round(1 - self.strategies["normal"] / strategies, 3)
+                if strategies
+                else None
+            ),
+        }
+
+
+class CircuitBreaker:
+    """Stop calling a host for a cooldown after repeated failed requests.
+
+    After the cooldown the breaker is half-open: a single probe request is
+    let through while other requests are still rejected. The breaker closes
+    if the probe succeeds and opens for another cooldown if it fails.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        """Initialize a closed breaker."""
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return if requests are paused for the cooldown."""
+        return (
+            self._opened_at is not None
+            and time.monotonic() - self._opened_at < self._cooldown
+        )
+
+    @property
+    def probing(self) -> bool:
+        """Return if a half-open probe request is in flight."""
+        return self._probing
+
+    def allow_request(self) -> bool:
+        """Return if a request may be sent, claiming the probe when half-open."""
+        if self._opened_at is None:
+            return True
+
+        if self._probing or self.is_open:
+            return False
+
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the breaker at the threshold.
+
+        A failed probe opens the breaker again straight away.
+        """
+        self._failures += 1
+        if self._probing or self._failures >= self._threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Let another request probe after a probe ended without a result."""
+        self._probing = False
+
+
+class RequestLimiter:
+    """Integration-wide limit on concurrent requests, with queue statistics."""
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limiter."""
+        self._limit = limit
+        self._active = 0
+        self._waiting = 0
+        self._condition = asyncio.Condition()
+        self._waits = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Return the maximum number of concurrent requests."""
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """Return the number of requests in flight."""
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return self._waiting
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return queue statistics, with wait times in seconds."""
+        avg_wait = self._total_wait / self._waits if self._waits else 0.0
+
+        return {
+            "limit": self._limit,
+            "active": self._active,
+            "queue_depth": self._waiting,
+            "requests": self._waits,
+            "last_wait": round(self._last_wait, 3),
+            "max_wait": round(self._max_wait, 3),
+            "avg_wait": round(avg_wait, 3),
+        }
+
+    async def async_set_limit(self, limit: int) -> None:
+        """Change the limit and wake waiters if it grew."""
+        async with self._condition:
+            self._limit = max(limit, 1)
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for and hold a request slot."""
+        started = time.monotonic()
+
+        async with self._condition:
+            self._waiting += 1
+            try:
+                await self._condition.wait_for(lambda: self._active < self._limit)
+            finally:
+                self._waiting -= 1
+            self._active += 1
+
+        waited = time.monotonic() - started
+        self._waits += 1
+        self._total_wait += waited
+        self._last_wait = waited
+        self._max_wait = max(self._max_wait, waited)
+
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._active -= 1
+                self._condition.notify()
+
+
+class SSMApiClient:
+    """Shared HTTP client for every SSM endpoint."""
+
+    def __init__(self, session: ClientSession) -> None:
+        """Initialize the client."""
+        self._session = session
+        self._timeout = ClientTimeout(total=API_REQUEST_TIMEOUT)
+        self.limiter = RequestLimiter(DEFAULT_MAX_CONCURRENT_REQUESTS)
+        self._breakers: dict[str, CircuitBreaker] = {}
+        # Validators and body hashes are kept per change key, so there is at
+        # most one entry per resource however often its URL changes.
+        self._validators: dict[str, tuple[str, dict[str, str]]] = {}
+        self._body_hashes: dict[str, str] = {}
+        self._in_flight: dict[tuple[str, str, str], asyncio.Task[ApiResponse]] = {}
+        self.metrics: dict[str, EndpointMetrics] = {}
+
+    def endpoint_metrics(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics for an endpoint name."""
+        return self.metrics.setdefault(endpoint, EndpointMetrics())
+
+    async def _async_request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> tuple[int, Mapping[str, str], bytes]:
+        """Send a request, retrying transient failures with backoff.
+
+        Connection errors, timeouts and 5xx responses are retried with
+        exponential backoff and full jitter. A request that still fails
+        counts against the host's circuit breaker.
+        """
+        host = urlsplit(url).hostname or url
+        breaker = self._breakers.setdefault(
+            host, CircuitBreaker(API_CIRCUIT_THRESHOLD, API_CIRCUIT_COOLDOWN)
+        )
+
+        metrics = self.endpoint_metrics(endpoint_name(url))
+
+        if not breaker.allow_request():
+            metrics.rejected += 1
+            record_request(method=method, url=url, error="circuit open")
+            raise SSMCircuitOpenError(
+                f"Requests to {host} are paused after repeated failures"
+            )
+
+        # A half-open probe is a single attempt, so a failing host sees one
+        # request per cooldown.
+        probe = breaker.probing
+        attempts = 1 if probe else API_MAX_ATTEMPTS
+
+        try:
+            error: ClientError | TimeoutError | None = None
+            status = 0
+            headers: Mapping[str, str] = {}
+            body = b""
+
+            for attempt in range(attempts):
+                if attempt:
+                    delay = random.uniform(0, API_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                    _LOGGER.debug(
+                        "Retrying %s %s in %.1f seconds (attempt %s of %s)",
+                        method,
+                        url,
+                        delay,
+                        attempt + 1,
+                        attempts,
+                    )
+                    await asyncio.sleep(delay)
+
+                async with self.limiter.slot():
+                    started = time.monotonic()
+                    try:
+                        async with self._session.request(
+                            method, url, timeout=self._timeout, **kwargs
+                        ) as response:
+                            status = response.status
+                            headers = response.headers
+                            body = await response.read() if status == 200 else b""
+                    except (ClientError, TimeoutError) as err:
+                        latency = time.monotonic() - started
+                        metrics.record_error(latency)
+                        record_request(
+                            method=method,
+                            url=url,
+                            payload=kwargs.get("json"),
+                            attempt=attempt + 1,
+                            latency=round(latency * 1000),
+                            error=f"{type(err).__name__}: {err}",
+                        )
+                        error = err
+                        continue
+
+                    latency = time.monotonic() - started
+                    metrics.record_response(latency, status, len(body))
+                    record_request(
+                        method=method,
+                        url=url,
+                        payload=kwargs.get("json"),
+                        attempt=attempt + 1,
+                        latency=round(latency * 1000),
+                        status=status,
+                        bytes=len(body),
+                    )
+
+                error = None
+                if status < 500:
+                    breaker.record_success()
+                    return status, headers, body
+
+            breaker.record_failure()
+            if breaker.is_open:
+                _LOGGER.warning(
+                    "Pausing requests to %s for %s seconds after repeated failures",
+                    host,
+                    API_CIRCUIT_COOLDOWN,
+                )
+
+            if error is not None:
+                raise error
+
+            return status, headers, body
+        finally:
+            if probe and breaker.probing:
+                breaker.release_probe()
+
+    async def _async_single_flight(
+        self,
+        key: tuple[str, str, str],
+        request: Callable[[], Coroutine[Any, Any, ApiResponse]],
+    ) -> ApiResponse:
+        """Share one in-flight request between concurrent identical calls."""
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.create_task(request())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _task: self._in_flight.pop(key, None))
+        else:
+            _LOGGER.debug("Joining in-flight request: %s %s", key[0], key[1])
+            self.endpoint_metrics(endpoint_name(key[1])).coalesced += 1
+            record_request(method=key[0], url=key[1], coalesced=True)
+
+        # Shielded so one caller giving up does not cancel the others.
+        return await asyncio.shield(task)
+
+    async def async_get(self, url: str, change_key: str | None = None) -> ApiResponse:
+        """GET a JSON resource.
+
+        With a change key, the request carries the validators from the last
+        response for the key if it was for the same URL, and a 304 or a body
+        identical to the last one seen for the key returns a not-modified
+        response without decoding.
+        Concurrent identical calls share a single request and response.
+        """
+        # The change key decides whether the result may be "not modified",
+        # so it takes the place of a request body in the in-flight key.
+        return await self._async_single_flight(
+            (hdrs.METH_GET, url, change_key or ""),
+            lambda: self._async_get(url, change_key),
+        )
+
+    async def _async_get(self, url: str, change_key: str | None) -> ApiResponse:
+        """GET a JSON resource without coalescing."""
+        headers: dict[str, str] = {}
+        if change_key is not None and change_key in self._validators:
+            validated_url, validators = self._validators[change_key]
+            if validated_url == url:
+                if etag := validators.get(hdrs.ETAG):
+                    headers[hdrs.IF_NONE_MATCH] = etag
+                if last_modified := validators.get(hdrs.LAST_MODIFIED):
+                    headers[hdrs.IF_MODIFIED_SINCE] = last_modified
+
+        status, response_headers, body = await self._async_request(
+            hdrs.METH_GET, url, headers=headers
+        )
+
+        metrics = self.endpoint_metrics(endpoint_name(url))
+
+        if status == 304:
+            _LOGGER.debug("Not modified: %s", url)
+            metrics.cache_hits += 1
+            return ApiResponse(status=304, not_modified=True)
+
+        if status != 200:
+            return ApiResponse(status=status)
+
+        digest = hashlib.sha256(body).hexdigest()
+        if change_key is not None:
+            validators = {
+                header: response_headers[header]
+                for header in (hdrs.ETAG, hdrs.LAST_MODIFIED)
+                if header in response_headers
+            }
+            if validators:
+                self._validators[change_key] = (url, validators)
+            else:
+                self._validators.pop(change_key, None)
+
+            if self._body_hashes.get(change_key) == digest:
+                _LOGGER.debug("Response body unchanged: %s", url)
+                metrics.cache_hits += 1
+                return ApiResponse(status=200, not_modified=True)
+
+            self._body_hashes[change_key] = digest
+
+        metrics.cache_misses += 1
+        return ApiResponse(status=200, data=json_loads(body))
+
+    async def async_post(self, url: str, payload: dict[str, Any]) -> ApiResponse:
+        """POST a JSON payload and decode the JSON response.
+
+        Concurrent calls with the same payload share a single request and
+        response.
+        """
+        return await self._async_single_flight(
+            (hdrs.METH_POST, url, json_dumps_sorted(payload)),
+            lambda: self._async_post(url, payload),
+        )
+
+    async def _async_post(self, url: str, payload: dict[str, Any]) -> ApiResponse:
+        """POST a JSON payload without coalescing."""
+        status, _headers, body = await self._async_request(
+            hdrs.METH_POST, url, json=payload
+        )
+
+        if status != 200:
+            return ApiResponse(status=status)
+
+        return ApiResponse(status=200, data=json_loads(body))
@@ -0,0 +1,197 @@
+"""Historical radiation backfill for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401, R0801, R0902, R0903
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from aiohttp import ClientError  # type: ignore
+from homeassistant.core import HomeAssistant, callback  # type: ignore
+from homeassistant.exceptions import HomeAssistantError  # type: ignore
+from homeassistant.helpers.storage import Store  # type: ignore
+
+from .api import SSMApiClient, parse_radiation_samples
+from .const import (
+    BACKFILL_CHUNK,
+    BACKFILL_CONCURRENCY,
+    BACKFILL_REQUEST_INTERVAL,
+    BACKFILL_STORAGE_KEY,
+    DOMAIN,
+    RADIATION_HISTORY_URL,
+    STORAGE_VERSION,
+)
+from .statistics_import import RadiationStatisticsImporter
+
+_LOGGER = logging.getLogger(__name__)
+
+_HOUR_MS = 3_600_000
+
+
+class RadiationBackfill:
+    """Fetch long ranges of station history into long-term statistics.
+
+    A range is split into hour-aligned chunks that are fetched a few at a
+    time, with a minimum interval between requests. The samples of each
+    chunk are imported as soon as it arrives and then dropped. After every
+    round of chunks, the job's progress is saved, so an interrupted job
+    resumes where it stopped.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: SSMApiClient) -> None:
+        """Initialize the backfill."""
+        self._hass = hass
+        self._client = client
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, BACKFILL_STORAGE_KEY
+        )
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._throttle_lock = asyncio.Lock()
+        self._next_request = 0.0
+        self._loaded = False
+
+    async def _async_load(self) -> None:
+        """Load saved jobs once."""
+        if self._loaded:
+            return
+
+        stored = await self._store.async_load()
+        if isinstance(stored, dict):
+            self._jobs = stored.get("jobs", {})
+
+        self._loaded = True
+
+    async def async_resume(self) -> None:
+        """Resume every job that was interrupted."""
+        await self._async_load()
+
+        for key in list(self._jobs):
+            _LOGGER.info("Resuming radiation backfill %s", key)
+            self._async_run(key)
+
+    async def async_backfill(self, station: str, start: int, end: int) -> None:
+        """Start backfilling a station between two Unix millisecond timestamps."""
+        if "recorder" not in self._hass.config.components:
+            raise HomeAssistantError("A radiation backfill needs the recorder")
+
+        # Only whole hours are imported, so an hour is never replaced by the
+        # statistics of part of its samples.
+        start -= start % _HOUR_MS
+        end -= end % _HOUR_MS
+        if start >= end:
+            raise HomeAssistantError(
+                "The backfill must cover at least one whole hour before its end"
+            )
+
+        await self._async_load()
+
+        key = f"{station}/{start}/{end}"
+        if key not in self._jobs:
+            self._jobs[key] = {
+                "station": station,
+                "start": start,
+                "end": end,
+                "next": start,
+            }
+            await self._store.async_save({"jobs": self._jobs})
+
+        self._async_run(key)
+
+    @callback
+    def _async_run(self, key: str) -> None:
+        """Run a job in the background unless it is already running."""
+        if key in self._tasks:
+            return
+
+        task = self._hass.async_create_background_task(
+            self._async_run_job(key), f"{DOMAIN} radiation backfill {key}"
+        )
+        self._tasks[key] = task
+        task.add_done_callback(lambda _task: self._tasks.pop(key, None))
+
+    async def _async_throttle(self) -> None:
+        """Wait until the next request may start."""
+        async with self._throttle_lock:
+            now = time.monotonic()
+            delay = self._next_request - now
+            self._next_request = (
+                max(now, self._next_request) + BACKFILL_REQUEST_INTERVAL
+            )
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _async_run_job(self, key: str) -> None:
+        """Fetch and import the remaining chunks of a job."""
+        job = self._jobs[key]
+        station = job["station"]
+        importer = RadiationStatisticsImporter(self._hass, station)
+        chunk_ms = int(BACKFILL_CHUNK.total_seconds() * 1000)
+
+        while job["next"] < job["end"]:
+            chunks: list[tuple[int, int]] = []
+            chunk_start = job["next"]
+            while chunk_start < job["end"] and len(chunks) < BACKFILL_CONCURRENCY:
+                chunk_end = min(chunk_start + chunk_ms, job["end"])
+                chunks.append((chunk_start, chunk_end))
+                chunk_start = chunk_end
+
+            try:
+                await asyncio.gather(
+                    *(
+                        self._async_fetch_chunk(importer, station, start, end)
+                        for start, end in chunks
+                    )
+                )
+            except (
+                ClientError,
+                TimeoutError,
+                ValueError,
+                KeyError,
+                TypeError,
+            ) as error:
+                _LOGGER.warning(
+                    "Radiation backfill %s stopped; it resumes on the next start: %s",
+                    key,
+                    error,
+                )
+                return
+
+            job["next"] = chunks[-1][1]
+            await self._store.async_save({"jobs": self._jobs})
+
+        del self._jobs[key]
+        await self._store.async_save({"jobs": self._jobs})
+        _LOGGER.info("Radiation backfill %s finished", key)
+
+    async def _async_fetch_chunk(
+        self,
+        importer: RadiationStatisticsImporter,
+        station: str,
+        start: int,
+        end: int,
+    ) -> None:
+        """Fetch one chunk and import its samples."""
+        await self._async_throttle()
+
+        url = f"{RADIATION_HISTORY_URL}?locationId={station}&start={start}&end={end}"
+        _LOGGER.debug("Sending backfill request to Radiation API: %s", url)
+
+        response = await self._client.async_get(url)
+        if response.status != 200:
+            raise ValueError(f"unexpected response status {response.status}")
+
+        # The API includes samples at both ends, and a sample at the end of a
+        # chunk belongs to the next one.
+        samples = [
+            (timestamp, value)
+            for timestamp, value in parse_radiation_samples(
+                response.data.get("values") or []
+            )
+            if start <= timestamp < end
+        ]
+        await importer.async_import(samples, skip_imported=False)
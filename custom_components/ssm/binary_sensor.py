@@ -0,0 +1,196 @@
+"""Binary sensor platform for Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401, R0801, R0903, R0913, R0917
+
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+from homeassistant.components.binary_sensor import (  # type: ignore
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry  # type: ignore
+from homeassistant.const import CONF_NAME  # type: ignore
+from homeassistant.core import HomeAssistant, callback  # type: ignore
+from homeassistant.helpers.entity_platform import (  # type: ignore
+    AddConfigEntryEntitiesCallback,
+)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity  # type: ignore
+
+from .api import RadiationData
+from .const import (
+    ANOMALY_SENSITIVITIES,
+    CONF_ALL_STATIONS,
+    CONF_ANOMALY_SENSITIVITY,
+    CONF_STATION,
+    DEFAULT_ANOMALY_SENSITIVITY,
+    STATIONS,
+)
+from .coordinator import (
+    MemberResult,
+    SSMDataUpdateCoordinator,
+    SSMNetworkCoordinator,
+    SSMRadiationCoordinator,
+    async_get_coordinators,
+)
+from .entity import device_info, entry_bool_value, entry_string_value
+
+_CoordinatorT = TypeVar("_CoordinatorT", bound=SSMDataUpdateCoordinator[Any])
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up SSM binary sensors based on a config entry."""
+    name = entry_string_value(config_entry, CONF_NAME, "SSM") or "SSM"
+    station = entry_string_value(config_entry, CONF_STATION)
+    sensitivity = (
+        entry_string_value(
+            config_entry, CONF_ANOMALY_SENSITIVITY, DEFAULT_ANOMALY_SENSITIVITY
+        )
+        or DEFAULT_ANOMALY_SENSITIVITY
+    )
+
+    coordinators = async_get_coordinators(hass)
+    entities: list[BinarySensorEntity] = []
+
+    if entry_bool_value(config_entry, CONF_ALL_STATIONS):
+        network = coordinators.radiation_network(config_entry.entry_id)
+        network.async_start()
+        entities.extend(
+            SSMNetworkRadiationAnomalySensor(
+                coordinator=network,
+                station=network_station["id"],
+                station_name=network_station["name"],
+                sensitivity=sensitivity,
+                name=name,
+                entry_id=config_entry.entry_id,
+            )
+            for network_station in STATIONS
+        )
+    elif station:
+        radiation_coordinator = coordinators.radiation(station, config_entry.entry_id)
+        radiation_coordinator.async_start()
+        entities.append(
+            SSMRadiationAnomalySensor(
+                coordinator=radiation_coordinator,
+                sensitivity=sensitivity,
+                name=name,
+                entry_id=config_entry.entry_id,
+            )
+        )
+
+    async_add_entities(entities)
+
+
+class SSMRadiationAnomalySensorBase(
+    CoordinatorEntity[_CoordinatorT], BinarySensorEntity
+):
+    """Anomaly state shared by the station and network binary sensors."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.SAFETY
+    _attr_translation_key = "radiation_anomaly"
+    _unrecorded_attributes = frozenset({"baseline", "z_score", "cusum"})
+
+    def __init__(
+        self,
+        coordinator: _CoordinatorT,
+        sensitivity: str,
+        name: str,
+        entry_id: str,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+
+        self._z_threshold, self._cusum_threshold = ANOMALY_SENSITIVITIES.get(
+            sensitivity, ANOMALY_SENSITIVITIES[DEFAULT_ANOMALY_SENSITIVITY]
+        )
+
+        self._attr_name = "Radiation Anomaly"
+        self._attr_unique_id = f"{entry_id}_radiation_anomaly"
+        self._attr_is_on: bool | None = None
+        self._attr_device_info = device_info(entry_id, name)
+        self._attr_extra_state_attributes: dict[str, Any] = {
+            "sensitivity": sensitivity,
+            "baseline": None,
+            "z_score": None,
+            "cusum": None,
+        }
+        self._update_from_coordinator()
+
+    @property
+    def available(self) -> bool:
+        """Return if the detector has a baseline to judge samples against."""
+        return super().available and self._attr_is_on is not None
+
+    def _radiation_data(self) -> RadiationData | None:
+        """Return the station data this sensor judges."""
+        raise NotImplementedError
+
+    def _update_from_coordinator(self) -> None:
+        """Apply the sensitivity thresholds to the shared detector scores."""
+        data = self._radiation_data()
+        if data is None or not data.anomaly.get("ready"):
+            self._attr_is_on = None
+            return
+
+        z_score = data.anomaly["z_score"]
+        cusum = data.anomaly["cusum"]
+
+        self._attr_is_on = (
+            z_score >= self._z_threshold or cusum >= self._cusum_threshold
+        )
+        # Detector levels are μSv/h. Attributes use nSv/h like the sensors.
+        self._attr_extra_state_attributes["baseline"] = round(
+            data.anomaly["baseline"] * 1000
+        )
+        self._attr_extra_state_attributes["z_score"] = round(z_score, 2)
+        self._attr_extra_state_attributes["cusum"] = round(cusum, 2)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+
+class SSMRadiationAnomalySensor(SSMRadiationAnomalySensorBase[SSMRadiationCoordinator]):
+    """Representation of a SSM Radiation Anomaly Sensor."""
+
+    def _radiation_data(self) -> RadiationData | None:
+        """Return the station data this sensor judges."""
+        return self.coordinator.data
+
+
+class SSMNetworkRadiationAnomalySensor(
+    SSMRadiationAnomalySensorBase[SSMNetworkCoordinator]
+):
+    """Representation of the anomaly sensor for one station of the network."""
+
+    def __init__(
+        self,
+        coordinator: SSMNetworkCoordinator,
+        station: str,
+        station_name: str,
+        sensitivity: str,
+        name: str,
+        entry_id: str,
+    ) -> None:
+        """Initialize the binary sensor."""
+        self._station = station
+        super().__init__(coordinator, sensitivity, name, entry_id)
+
+        self._attr_name = f"Radiation Anomaly {station_name}"
+        self._attr_unique_id = f"{entry_id}_radiation_anomaly_{station}"
+
+    def _radiation_data(self) -> RadiationData | None:
+        """Return the station data from the network results."""
+        results = self.coordinator.data
+        result: MemberResult | None = (
+            results.get(self._station) if results is not None else None
+        )
+        return result.data if result is not None else None
@@ -0,0 +1,132 @@
+"""Persistent response cache for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401, R0903
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback  # type: ignore
+from homeassistant.helpers.storage import Store  # type: ignore
+
+from .const import CACHE_MAX_AGE, CACHE_SAVE_DELAY, STORAGE_KEY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SSMCache:
+    """Last good SSM payloads, persisted with the time they were saved."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._swept_on: date | None = None
+
+    async def async_load(self) -> None:
+        """Load cached payloads from disk once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            stored = await self._store.async_load()
+            if isinstance(stored, dict):
+                # Drop payloads no TTL would accept any more, such as sun-time
+                # results for past days.
+                self._entries = {
+                    key: entry
+                    for key, entry in stored.items()
+                    if self._age(entry) <= CACHE_MAX_AGE
+                }
+
+            self._loaded = True
+            _LOGGER.debug("Loaded %s cached SSM payloads", len(self._entries))
+
+    @staticmethod
+    def _age(entry: dict[str, Any]) -> timedelta:
+        """Return how long ago a cache entry was saved."""
+        try:
+            saved_at = datetime.fromisoformat(entry["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            return timedelta.max
+
+        return datetime.now(UTC) - saved_at
+
+    @callback
+    def get(self, key: str, ttl: timedelta) -> Any | None:
+        """Return cached data for a key if it is younger than the TTL."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if self._age(entry) > ttl:
+            _LOGGER.debug("Ignoring expired cached SSM payload: %s", key)
+            return None
+
+        return entry.get("data")
+
+    @callback
+    def set(self, key: str, data: Any) -> None:
+        """Cache data for a key and schedule a write to disk.
+
+        Payloads no TTL would accept any more are dropped at the same time,
+        so a long-running instance does not keep results for past days.
+        """
+        now = datetime.now(UTC)
+        self._entries[key] = {
+            "saved_at": now.isoformat(),
+            "data": data,
+        }
+
+        # Ages are counted in days, so one sweep a day is enough.
+        if self._swept_on != now.date():
+            self._swept_on = now.date()
+            for stale_key in [
+                stale_key
+                for stale_key, entry in self._entries.items()
+                if self._age(entry) > CACHE_MAX_AGE
+            ]:
+                del self._entries[stale_key]
+
+        self._store.async_delay_save(lambda: self._entries, CACHE_SAVE_DELAY)
+
+    @callback
+    def remove_older(self, prefix: str, key: str) -> None:
+        """Drop the keys that share a prefix and sort before a key.
+
+        Keys ending in an ISO date sort by date, so this drops the payloads
+        for days before the key's day.
+        """
+        stale_keys = [
+            stale_key
+            for stale_key in self._entries
+            if stale_key.startswith(prefix) and stale_key < key
+        ]
+        if not stale_keys:
+            return
+
+        for stale_key in stale_keys:
+            del self._entries[stale_key]
+
+        _LOGGER.debug("Dropped %s cached SSM payloads for past days", len(stale_keys))
+        self._store.async_delay_save(lambda: self._entries, CACHE_SAVE_DELAY)
+
+    @callback
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return every cached payload with its age in seconds."""
+        diagnostics: dict[str, Any] = {}
+
+        for key, entry in sorted(self._entries.items()):
+            age = self._age(entry)
+            diagnostics[key] = {
+                "saved_at": entry.get("saved_at"),
+                "age": round(age.total_seconds()) if age != timedelta.max else None,
+                "data": entry.get("data"),
+            }
+
+        return diagnostics
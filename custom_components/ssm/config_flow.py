@@ -14,14 +14,25 @@ from homeassistant.config_entries import ConfigEntry, ConfigFlowResult  # type:
 from homeassistant.const import CONF_NAME  # type: ignore
 from homeassistant.core import HomeAssistant, callback  # type: ignore
 from homeassistant.helpers.selector import (  # type: ignore
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
 )
 
 from .const import (
+    ANOMALY_SENSITIVITIES,
+    CONF_ALL_LOCATIONS,
+    CONF_ALL_STATIONS,
+    CONF_ANOMALY_SENSITIVITY,
     CONF_LOCATION,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_SKIN_TYPE,
     CONF_STATION,
+    DEFAULT_ANOMALY_SENSITIVITY,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_NAME,
     DOMAIN,
     LOCATIONS,
@@ -99,6 +110,7 @@ def _config_schema() -> vol.Schema:
                     mode="dropdown",
                 )
             ),
+            vol.Optional(CONF_ALL_STATIONS, default=False): BooleanSelector(),
             vol.Optional(CONF_LOCATION): SelectSelector(
                 SelectSelectorConfig(
                     options=_location_options(),
@@ -106,6 +118,7 @@ def _config_schema() -> vol.Schema:
                     mode="dropdown",
                 )
             ),
+            vol.Optional(CONF_ALL_LOCATIONS, default=False): BooleanSelector(),
             vol.Optional(CONF_SKIN_TYPE): SelectSelector(
                 SelectSelectorConfig(
                     options=_skin_type_options(),
@@ -128,6 +141,7 @@ def _options_schema() -> vol.Schema:
                     mode="dropdown",
                 )
             ),
+            vol.Optional(CONF_ALL_STATIONS, default=False): BooleanSelector(),
             vol.Optional(CONF_LOCATION): SelectSelector(
                 SelectSelectorConfig(
                     options=_location_options(),
@@ -135,6 +149,7 @@ def _options_schema() -> vol.Schema:
                     mode="dropdown",
                 )
             ),
+            vol.Optional(CONF_ALL_LOCATIONS, default=False): BooleanSelector(),
             vol.Optional(CONF_SKIN_TYPE): SelectSelector(
                 SelectSelectorConfig(
                     options=_skin_type_options(),
@@ -142,6 +157,27 @@ def _options_schema() -> vol.Schema:
                     mode="dropdown",
                 )
             ),
+            vol.Optional(
+                CONF_ANOMALY_SENSITIVITY,
+                default=DEFAULT_ANOMALY_SENSITIVITY,
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=list(ANOMALY_SENSITIVITIES),
+                    translation_key="anomaly_sensitivity",
+                    mode="dropdown",
+                )
+            ),
+            vol.Optional(
+                CONF_MAX_CONCURRENT_REQUESTS,
+                default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=1,
+                    max=20,
+                    step=1,
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
         }
     )
 
@@ -222,14 +258,30 @@ class SSMOptionsFlow(config_entries.OptionsFlowWithReload):
                 CONF_STATION,
                 self.config_entry.data.get(CONF_STATION),
             ),
+            CONF_ALL_STATIONS: self.config_entry.options.get(
+                CONF_ALL_STATIONS,
+                self.config_entry.data.get(CONF_ALL_STATIONS, False),
+            ),
             CONF_LOCATION: self.config_entry.options.get(
                 CONF_LOCATION,
                 self.config_entry.data.get(CONF_LOCATION),
             ),
+            CONF_ALL_LOCATIONS: self.config_entry.options.get(
+                CONF_ALL_LOCATIONS,
+                self.config_entry.data.get(CONF_ALL_LOCATIONS, False),
+            ),
             CONF_SKIN_TYPE: self.config_entry.options.get(
                 CONF_SKIN_TYPE,
                 self.config_entry.data.get(CONF_SKIN_TYPE),
             ),
+            CONF_ANOMALY_SENSITIVITY: self.config_entry.options.get(
+                CONF_ANOMALY_SENSITIVITY,
+                DEFAULT_ANOMALY_SENSITIVITY,
+            ),
+            CONF_MAX_CONCURRENT_REQUESTS: self.config_entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS,
+                DEFAULT_MAX_CONCURRENT_REQUESTS,
+            ),
         }
 
         current_values = {
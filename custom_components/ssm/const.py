@@ -2,16 +2,90 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Final, NotRequired, TypedDict
+from zoneinfo import ZoneInfo
 
 DOMAIN: Final[str] = "ssm"
 
 CONF_STATION: Final[str] = "station"
 CONF_LOCATION: Final[str] = "location"
 CONF_SKIN_TYPE: Final[str] = "skin_type"
+CONF_MAX_CONCURRENT_REQUESTS: Final[str] = "max_concurrent_requests"
+CONF_ALL_STATIONS: Final[str] = "all_stations"
+CONF_ALL_LOCATIONS: Final[str] = "all_locations"
+CONF_ANOMALY_SENSITIVITY: Final[str] = "anomaly_sensitivity"
+CONF_START: Final[str] = "start"
+CONF_END: Final[str] = "end"
+
+SERVICE_BACKFILL_RADIATION: Final[str] = "backfill_radiation"
 
 DEFAULT_NAME: Final[str] = "SSM"
 
+UPDATE_INTERVAL: Final[timedelta] = timedelta(minutes=30)
+UV_INDEX_UPDATE_INTERVAL: Final[timedelta] = timedelta(hours=6)
+RADIATION_POLL_MIN_INTERVAL: Final[timedelta] = timedelta(minutes=5)
+RADIATION_POLL_MAX_INTERVAL: Final[timedelta] = timedelta(hours=2)
+POLL_MARGIN: Final[timedelta] = timedelta(minutes=5)
+RADIATION_HISTORY_RETENTION: Final[timedelta] = timedelta(hours=24)
+# Shortest expected gap between samples, used to size sample ring buffers.
+RADIATION_SAMPLE_MIN_INTERVAL: Final[timedelta] = timedelta(minutes=5)
+RADIATION_HISTORY_CAPACITY: Final[int] = int(
+    RADIATION_HISTORY_RETENTION / RADIATION_SAMPLE_MIN_INTERVAL
+)
+RADIATION_ROLLING_WINDOWS: Final[dict[str, timedelta]] = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+}
+STOCKHOLM_TIMEZONE: Final[ZoneInfo] = ZoneInfo("Europe/Stockholm")
+
+API_REQUEST_TIMEOUT: Final[int] = 30
+API_MAX_ATTEMPTS: Final[int] = 3
+API_RETRY_BASE_DELAY: Final[float] = 2.0
+API_CIRCUIT_THRESHOLD: Final[int] = 3
+API_CIRCUIT_COOLDOWN: Final[int] = 300
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final[int] = 4
+UPDATE_JITTER: Final[int] = 120
+NETWORK_REFRESH_CONCURRENCY: Final[int] = 4
+NETWORK_REFRESH_BUDGET: Final[timedelta] = timedelta(seconds=90)
+
+# EWMA weight of each new sample, CUSUM slack in standard deviations, the
+# smallest standard deviation in μSv/h, and samples needed before alerting.
+ANOMALY_EWMA_ALPHA: Final[float] = 0.05
+ANOMALY_CUSUM_SLACK: Final[float] = 0.5
+ANOMALY_MIN_STDEV: Final[float] = 0.005
+ANOMALY_WARMUP_SAMPLES: Final[int] = 24
+DEFAULT_ANOMALY_SENSITIVITY: Final[str] = "medium"
+# Sensitivity: (z-score threshold, CUSUM threshold).
+ANOMALY_SENSITIVITIES: Final[dict[str, tuple[float, float]]] = {
+    "low": (5.0, 10.0),
+    "medium": (4.0, 6.0),
+    "high": (3.0, 4.0),
+}
+
+STORAGE_KEY: Final[str] = DOMAIN
+STORAGE_VERSION: Final[int] = 1
+CACHE_SAVE_DELAY: Final[int] = 30
+CACHE_TTL_RADIATION: Final[timedelta] = timedelta(hours=6)
+CACHE_TTL_RADIATION_STATE: Final[timedelta] = timedelta(days=30)
+CACHE_TTL_UV_INDEX: Final[timedelta] = timedelta(hours=12)
+CACHE_TTL_SUN_TIME: Final[timedelta] = timedelta(hours=1)
+CACHE_TTL_SUN_TIME_INDEX: Final[timedelta] = timedelta(days=30)
+CACHE_TTL_SUN_TIME_LOCATION: Final[timedelta] = timedelta(days=2)
+CACHE_MAX_AGE: Final[timedelta] = timedelta(days=31)
+
+# Update traces kept per coordinator or sensor for config entry diagnostics.
+DIAGNOSTICS_TRACE_LIMIT: Final[int] = 20
+
+BACKFILL_STORAGE_KEY: Final[str] = f"{DOMAIN}.backfill"
+BACKFILL_CHUNK: Final[timedelta] = timedelta(days=1)
+BACKFILL_CONCURRENCY: Final[int] = 2
+BACKFILL_REQUEST_INTERVAL: Final[float] = 1.0
+
+SUN_TIME_MAX_UV_INDEX: Final[int] = 15
+SUN_TIME_PREFILL_CONCURRENCY: Final[int] = 2
+
 MANUFACTURER: Final[str] = "Swedish Radiation Safety Authority"
 MODEL: Final[str] = "Radiation and UV Monitor"
 
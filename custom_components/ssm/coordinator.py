@@ -0,0 +1,961 @@
+"""Data update coordinators for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401, R0902, R0903, R0913, R0914, R0917, W0201, W0613, W0718
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
+from urllib.parse import quote
+
+from aiohttp import ClientError  # type: ignore
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback  # type: ignore
+from homeassistant.helpers.aiohttp_client import async_get_clientsession  # type: ignore
+from homeassistant.helpers.event import (  # type: ignore
+    async_call_later,
+    async_track_time_change,
+)
+from homeassistant.helpers.update_coordinator import (  # type: ignore
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .anomaly import RadiationAnomalyDetector
+from .api import (
+    ENDPOINT_RADIATION,
+    RadiationData,
+    SSMApiClient,
+    UVIndexData,
+    parse_radiation_samples,
+    parse_uv_index,
+)
+from .backfill import RadiationBackfill
+from .cache import SSMCache
+from .const import (
+    ANOMALY_CUSUM_SLACK,
+    ANOMALY_EWMA_ALPHA,
+    ANOMALY_MIN_STDEV,
+    ANOMALY_WARMUP_SAMPLES,
+    CACHE_TTL_RADIATION,
+    CACHE_TTL_RADIATION_STATE,
+    CACHE_TTL_UV_INDEX,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DOMAIN,
+    LOCATIONS,
+    NETWORK_REFRESH_BUDGET,
+    NETWORK_REFRESH_CONCURRENCY,
+    POLL_MARGIN,
+    RADIATION_HISTORY_CAPACITY,
+    RADIATION_HISTORY_RETENTION,
+    RADIATION_HISTORY_URL,
+    RADIATION_POLL_MAX_INTERVAL,
+    RADIATION_POLL_MIN_INTERVAL,
+    RADIATION_ROLLING_WINDOWS,
+    RADIATION_SAMPLE_MIN_INTERVAL,
+    STATIONS,
+    STOCKHOLM_TIMEZONE,
+    UPDATE_INTERVAL,
+    UPDATE_JITTER,
+    UV_INDEX_UPDATE_INTERVAL,
+    UV_INDEX_URL,
+)
+from .ring_buffer import SampleRingBuffer
+from .rolling import RollingStatistics
+from .scheduler import AdaptivePollScheduler
+from .statistics_import import RadiationStatisticsImporter
+from .sun_time import SSMSunTimeIndexTable, SSMSunTimeLocationTable
+from .tracing import TraceBuffer, record_branch, trace_buffer, trace_update
+
+_LOGGER = logging.getLogger(__name__)
+
+_DataT = TypeVar("_DataT")
+
+_HOUR_MS = 3_600_000
+
+
+def _samples_from_columns(columns: dict[str, list[Any]]) -> list[tuple[int, float]]:
+    """Return (timestamp, value) pairs from stored timestamp and value lists."""
+    return list(
+        zip(
+            map(int, columns.get("timestamps", [])),
+            map(float, columns.get("values", [])),
+            strict=True,
+        )
+    )
+
+
+class SSMDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
+    """Base coordinator shared by every config entry using the same resource."""
+
+    cache_ttl: timedelta
+    data: _DataT | None
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SSMApiClient,
+        cache: SSMCache,
+        cache_key: str,
+        name: str,
+        update_interval: timedelta = UPDATE_INTERVAL,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=None,
+            name=name,
+            update_interval=update_interval,
+            always_update=False,
+        )
+        self._client = client
+        self._cache = cache
+        self._cache_key = cache_key
+        self._started = False
+        self._unsub_first_refresh: CALLBACK_TYPE | None = None
+        self._scheduler: AdaptivePollScheduler | None = None
+        # A fixed random phase, added to the first refresh and to every
+        # scheduled interval, so coordinators created together or polling
+        # for the same publish time do not hit the API in lockstep.
+        self._phase = timedelta(seconds=random.uniform(0, UPDATE_JITTER))
+        self.traces = trace_buffer()
+
+    @callback
+    def async_start(self) -> None:
+        """Restore cached data and refresh in the background, once."""
+        if self._started:
+            return
+
+        self._started = True
+        self.async_restore()
+
+        self._unsub_first_refresh = async_call_later(
+            self.hass, self._phase.total_seconds(), self._async_first_refresh
+        )
+
+    @callback
+    def async_restore(self) -> None:
+        """Restore cached data if there is no data yet, without refreshing."""
+        if self.data is not None:
+            return
+
+        cached = self._cache.get(self._cache_key, self.cache_ttl)
+        if cached is None:
+            return
+
+        try:
+            self.data = self._from_cache(cached)
+        except (KeyError, TypeError, ValueError) as error:
+            _LOGGER.debug("Ignoring invalid cached data for %s: %s", self.name, error)
+        else:
+            _LOGGER.debug("Restored cached data for %s", self.name)
+
+    @callback
+    def _async_first_refresh(self, _now: datetime | None = None) -> None:
+        """Run the first refresh in the background."""
+        self._unsub_first_refresh = None
+        self.hass.async_create_background_task(
+            self.async_refresh(),
+            f"{self.name} initial refresh",
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending first refresh."""
+        if self._unsub_first_refresh is not None:
+            self._unsub_first_refresh()
+            self._unsub_first_refresh = None
+
+        await super().async_shutdown()
+
+    async def _async_update_data(self) -> _DataT:
+        """Fetch new data and remember it as the last good payload."""
+        previous = self.data
+        with trace_update(self.traces, self.name):
+            data = await self._async_fetch_data()
+
+        if data is not previous:
+            self._cache.set(self._cache_key, self._to_cache(data))
+
+        if self._scheduler is not None:
+            now = datetime.now(UTC)
+            self._scheduler.observe(now, self._published_at(previous, data))
+            self.update_interval = self._scheduler.next_interval(now) + self._phase
+
+        return data
+
+    async def _async_fetch_data(self) -> _DataT:
+        """Fetch new data from the API."""
+        raise NotImplementedError
+
+    def _published_at(self, previous: _DataT | None, data: _DataT) -> datetime | None:
+        """Return when the newest data was published, or None if unchanged."""
+        return None
+
+    def _to_cache(self, data: _DataT) -> Any:
+        """Return a JSON serializable form of the data."""
+        return asdict(data)  # type: ignore[call-overload]
+
+    def _from_cache(self, cached: Any) -> _DataT:
+        """Rebuild data from its cached form."""
+        raise NotImplementedError
+
+
+class SSMRadiationCoordinator(SSMDataUpdateCoordinator[RadiationData]):
+    """Fetch radiation history for a single station."""
+
+    cache_ttl = CACHE_TTL_RADIATION
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SSMApiClient,
+        cache: SSMCache,
+        station: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            client,
+            cache,
+            cache_key=f"radiation/{station}",
+            name=f"{DOMAIN} radiation {station}",
+        )
+        self.station = station
+        # The sample history and the state derived from it outlive the data
+        # shown by entities, so they are cached under their own key.
+        self._state_key = f"radiation_state/{station}"
+        self.history = SampleRingBuffer(RADIATION_HISTORY_CAPACITY)
+        self.statistics = RollingStatistics(
+            RADIATION_ROLLING_WINDOWS, RADIATION_SAMPLE_MIN_INTERVAL
+        )
+        self.anomaly = RadiationAnomalyDetector(
+            alpha=ANOMALY_EWMA_ALPHA,
+            slack=ANOMALY_CUSUM_SLACK,
+            min_stdev=ANOMALY_MIN_STDEV,
+            warmup=ANOMALY_WARMUP_SAMPLES,
+        )
+        self.long_term_statistics = RadiationStatisticsImporter(hass, station)
+        self._scheduler = AdaptivePollScheduler(
+            self.name,
+            default_interval=UPDATE_INTERVAL,
+            min_interval=RADIATION_POLL_MIN_INTERVAL,
+            max_interval=RADIATION_POLL_MAX_INTERVAL,
+            margin=POLL_MARGIN,
+        )
+
+    def _published_at(
+        self,
+        previous: RadiationData | None,
+        data: RadiationData,
+    ) -> datetime | None:
+        """Return the timestamp of the newest sample in the history."""
+        last_timestamp = self.history.last_timestamp
+        if last_timestamp is None:
+            return None
+
+        return datetime.fromtimestamp(last_timestamp / 1000, UTC)
+
+    @callback
+    def async_restore(self) -> None:
+        """Restore the sample history and detector state, then the data."""
+        if not self.history:
+            state = self._cache.get(self._state_key, CACHE_TTL_RADIATION_STATE)
+            if state is not None:
+                try:
+                    self._restore_state(state)
+                except (KeyError, TypeError, ValueError) as error:
+                    _LOGGER.debug(
+                        "Ignoring invalid cached state for %s: %s", self.name, error
+                    )
+
+        super().async_restore()
+
+    def _state_to_cache(self) -> dict[str, Any]:
+        """Return the sample history and derived state in JSON serializable form."""
+        timestamps, values = self.history.columns()
+        rolling_timestamps, rolling_values = self.statistics.columns()
+        return {
+            "history": {"timestamps": timestamps, "values": values},
+            "rolling": {"timestamps": rolling_timestamps, "values": rolling_values},
+            "anomaly": self.anomaly.as_dict(),
+        }
+
+    def _restore_state(self, state: dict[str, Any]) -> None:
+        """Rebuild the sample history, statistics and anomaly detector."""
+        self.history.extend(_samples_from_columns(state["history"]))
+        self.statistics.add(_samples_from_columns(state.get("rolling", {})))
+        if "anomaly" in state:
+            self.anomaly.restore(state["anomaly"])
+
+    def _to_cache(self, data: RadiationData) -> Any:
+        """Return the data in JSON serializable form."""
+        return {"data": asdict(data)}
+
+    def _from_cache(self, cached: Any) -> RadiationData:
+        """Rebuild data from its cached form."""
+        return RadiationData(**cached["data"])
+
+    async def _async_fetch_history(self, start: int, end: int) -> None:
+        """Fetch samples between two Unix millisecond timestamps into history."""
+        url = (
+            f"{RADIATION_HISTORY_URL}?locationId={self.station}&start={start}&end={end}"
+        )
+
+        _LOGGER.debug("Sending request to Radiation API: %s", url)
+
+        try:
+            response = await self._client.async_get(
+                url,
+                change_key=self._cache_key if self.data is not None else None,
+            )
+
+            if response.not_modified:
+                return
+
+            if response.status != 200:
+                raise UpdateFailed(
+                    f"Failed to fetch radiation data from SSM API: {response.status}"
+                )
+
+            data = response.data
+            _LOGGER.debug("Received response from Radiation API: %s", data)
+
+            samples = parse_radiation_samples(data.get("values") or [])
+            added = self.history.extend(samples)
+            derived = self.statistics.add(samples) + self.anomaly.add(samples)
+
+        except (ClientError, TimeoutError, ValueError, KeyError, TypeError) as error:
+            raise UpdateFailed(f"Error updating SSM radiation data: {error}") from error
+
+        _LOGGER.debug(
+            "Merged %s new radiation samples for station %s (%s stored)",
+            added,
+            self.station,
+            len(self.history),
+        )
+
+        if added or derived:
+            self._cache.set(self._state_key, self._state_to_cache())
+
+        if samples:
+            # The first hour of the batch may also hold samples from earlier
+            # fetches, so import the touched hours from the whole history.
+            first_hour = samples[0][0] - samples[0][0] % _HOUR_MS
+            await self.long_term_statistics.async_import(self.history.since(first_hour))
+
+    async def _async_fetch_data(self) -> RadiationData:
+        """Get the latest data from the API."""
+        now = datetime.now(STOCKHOLM_TIMEZONE)
+        is_dst = bool(now.dst())
+
+        def get_time_range(strategy: str) -> tuple[int, int]:
+            """Return query time range in Unix milliseconds."""
+            end = now.replace(minute=0, second=0, microsecond=0)
+
+            if strategy == "normal":
+                start = end - timedelta(hours=3 if is_dst else 2)
+            elif strategy == "fallback":
+                start = end - timedelta(hours=4 if is_dst else 3)
+            elif strategy == "midnight":
+                start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            else:
+                raise ValueError(f"Unknown strategy: {strategy}")
+
+            return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+
+        windows = {
+            strategy: get_time_range(strategy)
+            for strategy in ("normal", "fallback", "midnight")
+        }
+        end_timestamp = max(end for _start, end in windows.values())
+
+        # The first query covers every strategy window. Later queries only ask
+        # for samples newer than the last one already in the history.
+        last_timestamp = self.history.last_timestamp
+        if last_timestamp is None:
+            start_timestamp = min(start for start, _end in windows.values())
+        else:
+            # After a long downtime, catch up on the retained span only.
+            start_timestamp = max(
+                last_timestamp,
+                end_timestamp - int(RADIATION_HISTORY_RETENTION.total_seconds() * 1000),
+            )
+
+        if start_timestamp < end_timestamp:
+            await self._async_fetch_history(start_timestamp, end_timestamp)
+        else:
+            _LOGGER.debug(
+                "Radiation history for station %s is current; skipping request",
+                self.station,
+            )
+
+        for strategy, (window_start, window_end) in windows.items():
+            window = self.history.window(window_start, window_end)
+
+            if window is None:
+                _LOGGER.debug(
+                    "No valid numeric radiation values in %s window for station %s",
+                    strategy,
+                    self.station,
+                )
+                continue
+
+            _LOGGER.debug(
+                "Using %s window for station %s: %s values",
+                strategy,
+                self.station,
+                window.count,
+            )
+            self._client.endpoint_metrics(ENDPOINT_RADIATION).strategies[strategy] += 1
+            record_branch(strategy)
+
+            latest = window.latest
+            minimum = window.minimum
+            maximum = window.maximum
+            average = window.mean
+            rolling = self.statistics.stats()
+            anomaly = self.anomaly.state()
+
+            # Keep the previous object when nothing changed so that listeners
+            # are not called and no state is written.
+            previous = self.data
+            if previous is not None and (
+                previous.latest,
+                previous.minimum,
+                previous.maximum,
+                previous.average,
+                previous.rolling,
+                previous.anomaly,
+            ) == (latest, minimum, maximum, average, rolling, anomaly):
+                return previous
+
+            return RadiationData(
+                latest=latest,
+                minimum=minimum,
+                maximum=maximum,
+                average=average,
+                last_updated=datetime.now(UTC).isoformat(),
+                rolling=rolling,
+                anomaly=anomaly,
+            )
+
+        raise UpdateFailed(
+            "Failed to retrieve valid radiation data after all fallback attempts."
+        )
+
+
+class SSMUVIndexCoordinator(SSMDataUpdateCoordinator[UVIndexData]):
+    """Fetch the UV index forecast for a single API location."""
+
+    cache_ttl = CACHE_TTL_UV_INDEX
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SSMApiClient,
+        cache: SSMCache,
+        api_location: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            client,
+            cache,
+            cache_key=f"uv_index/{api_location}",
+            name=f"{DOMAIN} UV index {api_location}",
+            update_interval=UV_INDEX_UPDATE_INTERVAL,
+        )
+        self.api_location = api_location
+        self._unsub_hour_tick: CALLBACK_TYPE | None = None
+        self._scheduler = AdaptivePollScheduler(
+            self.name,
+            default_interval=UV_INDEX_UPDATE_INTERVAL,
+            min_interval=UPDATE_INTERVAL,
+            max_interval=UV_INDEX_UPDATE_INTERVAL,
+            margin=POLL_MARGIN,
+        )
+
+    def _published_at(
+        self,
+        previous: UVIndexData | None,
+        data: UVIndexData,
+    ) -> datetime | None:
+        """Return now if the forecast differs from the previous one.
+
+        The API does not say when a forecast was issued, so the first poll
+        that sees a changed forecast stands in for its publish time.
+        """
+        if (
+            previous is not None
+            and previous.date == data.date
+            and previous.hourly_uv_index == data.hourly_uv_index
+            and previous.max_uv_tomorrow == data.max_uv_tomorrow
+        ):
+            return None
+
+        return datetime.now(UTC)
+
+    @callback
+    def async_start(self) -> None:
+        """Start the hourly tick along with the first refresh."""
+        if self._unsub_hour_tick is None:
+            self._unsub_hour_tick = async_track_time_change(
+                self.hass, self._async_hour_tick, minute=0, second=0
+            )
+
+        super().async_start()
+
+    async def async_shutdown(self) -> None:
+        """Stop the hourly tick."""
+        if self._unsub_hour_tick is not None:
+            self._unsub_hour_tick()
+            self._unsub_hour_tick = None
+
+        await super().async_shutdown()
+
+    @callback
+    def _async_hour_tick(self, now: datetime) -> None:
+        """Move entities to the next hour of the forecast already in memory.
+
+        The forecast covers the whole day, so a new hour only needs a fetch
+        when the data is missing or is not for today.
+        """
+        today = now.astimezone(STOCKHOLM_TIMEZONE).date().isoformat()
+
+        if self.data is None or self.data.date != today:
+            _LOGGER.debug("UV forecast for %s is stale; refreshing", self.api_location)
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        self.async_update_listeners()
+
+    def _from_cache(self, cached: Any) -> UVIndexData:
+        """Rebuild data from its cached form, if it is still today's forecast."""
+        data = UVIndexData.from_dict(cached)
+
+        if data.date != datetime.now(STOCKHOLM_TIMEZONE).date().isoformat():
+            raise ValueError(f"forecast is for {data.date}")
+
+        return data
+
+    async def _async_fetch_data(self) -> UVIndexData:
+        """Get the latest data from the API."""
+        now = datetime.now(STOCKHOLM_TIMEZONE)
+        offset = "-2" if now.dst() else "-1"
+
+        encoded_location = quote(self.api_location, safe="")
+        url = f"{UV_INDEX_URL.format(location=encoded_location)}?offset={offset}"
+
+        _LOGGER.debug("Sending request to UV Index API: %s", url)
+
+        previous = self.data
+        current = previous is not None and previous.date == now.date().isoformat()
+
+        try:
+            response = await self._client.async_get(
+                url,
+                change_key=self._cache_key if current else None,
+            )
+
+            if response.not_modified and previous is not None:
+                record_branch("not_modified")
+                return previous
+
+            if response.status != 200:
+                raise UpdateFailed(
+                    f"Failed to fetch UV index data from SSM API: {response.status}"
+                )
+
+            data = response.data
+            _LOGGER.debug("Received response from UV Index API: %s", data)
+
+            record_branch("updated")
+            return parse_uv_index(data, now.date().isoformat())
+
+        except (ClientError, TimeoutError, ValueError, KeyError, TypeError) as error:
+            raise UpdateFailed(f"Error updating SSM UV index data: {error}") from error
+
+
+@dataclass(slots=True)
+class MemberResult:
+    """Latest data and refresh outcome for one member of a network."""
+
+    data: Any
+    success: bool
+    duration: float | None = None
+
+
+class SSMNetworkCoordinator(SSMDataUpdateCoordinator[dict[str, MemberResult]]):
+    """Refresh many coordinators as one pipeline with a time budget.
+
+    Members are not scheduled on their own. Each network refresh runs them
+    with bounded concurrency; members still running when the budget is spent
+    are cancelled and keep their previous data. The next refresh is due when
+    the first member expects new data.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SSMApiClient,
+        cache: SSMCache,
+        name: str,
+        members: dict[str, SSMDataUpdateCoordinator[Any]],
+        min_interval: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            client,
+            cache,
+            cache_key=f"network/{name}",
+            name=f"{DOMAIN} {name} network",
+        )
+        self.members = members
+        self.last_refresh_duration: float | None = None
+        self._min_interval = min_interval
+
+    @callback
+    def async_restore(self) -> None:
+        """Restore every member from the cache."""
+        for member in self.members.values():
+            member.async_restore()
+
+        if any(member.data is not None for member in self.members.values()):
+            self.data = {
+                key: MemberResult(data=member.data, success=True)
+                for key, member in self.members.items()
+            }
+
+    async def _async_update_data(self) -> dict[str, MemberResult]:
+        """Refresh every member within the time budget."""
+        with trace_update(self.traces, self.name):
+            return await self._async_refresh_members()
+
+    async def _async_refresh_members(self) -> dict[str, MemberResult]:
+        """Refresh the members and collect their results."""
+        semaphore = asyncio.Semaphore(NETWORK_REFRESH_CONCURRENCY)
+        durations: dict[str, float] = {}
+        started = time.monotonic()
+
+        async def refresh(key: str, member: SSMDataUpdateCoordinator[Any]) -> None:
+            async with semaphore:
+                member_started = time.monotonic()
+                await member.async_refresh()
+                durations[key] = time.monotonic() - member_started
+
+        tasks = [
+            asyncio.create_task(refresh(key, member))
+            for key, member in self.members.items()
+        ]
+        _done, pending = await asyncio.wait(
+            tasks, timeout=NETWORK_REFRESH_BUDGET.total_seconds()
+        )
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+            _LOGGER.warning(
+                "%s of %s members of %s were not refreshed within %s",
+                len(pending),
+                len(tasks),
+                self.name,
+                NETWORK_REFRESH_BUDGET,
+            )
+
+        self.last_refresh_duration = time.monotonic() - started
+        self.update_interval = max(
+            self._min_interval,
+            min(
+                member.update_interval or UPDATE_INTERVAL
+                for member in self.members.values()
+            ),
+        )
+
+        results = {
+            key: MemberResult(
+                data=member.data,
+                success=key in durations and member.last_update_success,
+                duration=durations.get(key),
+            )
+            for key, member in self.members.items()
+        }
+
+        if not any(result.data is not None for result in results.values()):
+            raise UpdateFailed(f"No data for any member of {self.name}")
+
+        refreshed = sum(result.success for result in results.values())
+        record_branch(f"{refreshed} of {len(results)} members refreshed")
+        _LOGGER.debug(
+            "Refreshed %s of %s members of %s in %.1f seconds",
+            refreshed,
+            len(results),
+            self.name,
+            self.last_refresh_duration,
+        )
+
+        return results
+
+    async def async_refresh_members(self, keys: list[str]) -> None:
+        """Refresh some members and publish their results with the others.
+
+        The scheduled refresh of the whole network is left as it is.
+        """
+        semaphore = asyncio.Semaphore(NETWORK_REFRESH_CONCURRENCY)
+
+        async def refresh(key: str) -> MemberResult:
+            member = self.members[key]
+            async with semaphore:
+                started = time.monotonic()
+                await member.async_refresh()
+            return MemberResult(
+                data=member.data,
+                success=member.last_update_success,
+                duration=time.monotonic() - started,
+            )
+
+        refreshed = await asyncio.gather(*(refresh(key) for key in keys))
+
+        # Publish without async_set_updated_data, which would push back the
+        # scheduled refresh of every member.
+        self.data = {**(self.data or {}), **dict(zip(keys, refreshed, strict=True))}
+        self.async_update_listeners()
+
+
+class SSMUVIndexNetworkCoordinator(SSMNetworkCoordinator):
+    """Refresh every UV index location and move entities on to each new hour."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SSMApiClient,
+        cache: SSMCache,
+        members: dict[str, SSMDataUpdateCoordinator[Any]],
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            client,
+            cache,
+            "uv_index",
+            members,
+            min_interval=UPDATE_INTERVAL,
+        )
+        self._unsub_hour_tick: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the hourly tick along with the first refresh."""
+        if self._unsub_hour_tick is None:
+            self._unsub_hour_tick = async_track_time_change(
+                self.hass, self._async_hour_tick, minute=0, second=0
+            )
+
+        super().async_start()
+
+    async def async_shutdown(self) -> None:
+        """Stop the hourly tick."""
+        if self._unsub_hour_tick is not None:
+            self._unsub_hour_tick()
+            self._unsub_hour_tick = None
+
+        await super().async_shutdown()
+
+    @callback
+    def _async_hour_tick(self, now: datetime) -> None:
+        """Move entities to the next hour, refreshing only stale forecasts."""
+        if self.data is None:
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        today = now.astimezone(STOCKHOLM_TIMEZONE).date().isoformat()
+        stale = [
+            key
+            for key, member in self.members.items()
+            if member.data is None or member.data.date != today
+        ]
+
+        if stale:
+            _LOGGER.debug(
+                "%s UV forecasts in %s are stale; refreshing them",
+                len(stale),
+                self.name,
+            )
+            self.hass.async_create_task(self.async_refresh_members(stale))
+
+        self.async_update_listeners()
+
+
+class SSMCoordinators:
+    """Coordinators shared across config entries, keyed by upstream resource."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self._hass = hass
+        self.client = SSMApiClient(async_get_clientsession(hass))
+        self.cache = SSMCache(hass)
+        self.sun_time_index = SSMSunTimeIndexTable(self.client, self.cache)
+        self.sun_time_location = SSMSunTimeLocationTable(hass, self.client, self.cache)
+        self.backfill = RadiationBackfill(hass, self.client)
+        self._coordinators: dict[tuple[str, str], SSMDataUpdateCoordinator[Any]] = {}
+        self._users: dict[tuple[str, str], set[str]] = {}
+        self._concurrency_limits: dict[str, int] = {}
+        self._entity_traces: dict[str, dict[str, TraceBuffer]] = {}
+        self._diagnostics_entry_id: str | None = None
+
+    def _concurrency_limit(self) -> int:
+        """Return the lowest request limit of the loaded entries."""
+        return min(
+            self._concurrency_limits.values(), default=DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+
+    async def async_set_concurrency_limit(self, entry_id: str, limit: int) -> None:
+        """Apply the lowest request limit configured by any loaded entry."""
+        self._concurrency_limits[entry_id] = limit
+        await self.client.limiter.async_set_limit(self._concurrency_limit())
+
+    def _acquire(
+        self,
+        key: tuple[str, str],
+        entry_id: str,
+        factory: Callable[[], SSMDataUpdateCoordinator[Any]],
+    ) -> Any:
+        """Return the coordinator for a key, creating it on first use."""
+        if key not in self._coordinators:
+            self._coordinators[key] = factory()
+
+        self._users.setdefault(key, set()).add(entry_id)
+        return self._coordinators[key]
+
+    @callback
+    def radiation(self, station: str, entry_id: str) -> SSMRadiationCoordinator:
+        """Return the shared radiation coordinator for a station."""
+        return self._acquire(
+            ("radiation", station),
+            entry_id,
+            lambda: SSMRadiationCoordinator(
+                self._hass, self.client, self.cache, station
+            ),
+        )
+
+    @callback
+    def uv_index(self, api_location: str, entry_id: str) -> SSMUVIndexCoordinator:
+        """Return the shared UV index coordinator for an API location."""
+        return self._acquire(
+            ("uv_index", api_location),
+            entry_id,
+            lambda: SSMUVIndexCoordinator(
+                self._hass, self.client, self.cache, api_location
+            ),
+        )
+
+    @callback
+    def radiation_network(self, entry_id: str) -> SSMNetworkCoordinator:
+        """Return the shared coordinator for every radiation station."""
+        stations: dict[str, SSMDataUpdateCoordinator[Any]] = {
+            station["id"]: self.radiation(station["id"], entry_id)
+            for station in STATIONS
+        }
+        return self._acquire(
+            ("network", "radiation"),
+            entry_id,
+            lambda: SSMNetworkCoordinator(
+                self._hass,
+                self.client,
+                self.cache,
+                "radiation",
+                stations,
+                min_interval=RADIATION_POLL_MIN_INTERVAL,
+            ),
+        )
+
+    @callback
+    def uv_index_network(self, entry_id: str) -> SSMUVIndexNetworkCoordinator:
+        """Return the shared coordinator for every UV index location."""
+        locations: dict[str, SSMDataUpdateCoordinator[Any]] = {
+            location["id"]: self.uv_index(location["api_name"], entry_id)
+            for location in LOCATIONS
+        }
+        return self._acquire(
+            ("network", "uv_index"),
+            entry_id,
+            lambda: SSMUVIndexNetworkCoordinator(
+                self._hass, self.client, self.cache, locations
+            ),
+        )
+
+    @callback
+    def claim_diagnostics(self, entry_id: str) -> bool:
+        """Return if an entry provides the integration-wide diagnostic entities.
+
+        The first entry set up claims them; they move to another entry when
+        it unloads.
+        """
+        if self._diagnostics_entry_id in (None, entry_id):
+            self._diagnostics_entry_id = entry_id
+            return True
+
+        return False
+
+    @property
+    def diagnostics_entry_id(self) -> str | None:
+        """Return the entry providing the integration-wide diagnostic entities."""
+        return self._diagnostics_entry_id
+
+    @callback
+    def entity_traces(self, entry_id: str, source: str) -> TraceBuffer:
+        """Return the trace buffer of an entity that calls the API itself."""
+        return self._entity_traces.setdefault(entry_id, {}).setdefault(
+            source, trace_buffer()
+        )
+
+    @callback
+    def entry_coordinators(self, entry_id: str) -> list[SSMDataUpdateCoordinator[Any]]:
+        """Return the coordinators used by an entry."""
+        return [
+            self._coordinators[key]
+            for key, users in self._users.items()
+            if entry_id in users
+        ]
+
+    @callback
+    def entry_traces(self, entry_id: str) -> dict[str, TraceBuffer]:
+        """Return the trace buffers of an entry's own entities."""
+        return self._entity_traces.get(entry_id, {})
+
+    @callback
+    def async_release(self, entry_id: str) -> None:
+        """Drop an entry's subscriptions and forget coordinators nobody uses."""
+        if self._concurrency_limits.pop(entry_id, None) is not None:
+            self._hass.async_create_task(
+                self.client.limiter.async_set_limit(self._concurrency_limit())
+            )
+        self._entity_traces.pop(entry_id, None)
+        if self._diagnostics_entry_id == entry_id:
+            self._diagnostics_entry_id = None
+
+        for key in list(self._users):
+            users = self._users[key]
+            users.discard(entry_id)
+
+            if not users:
+                _LOGGER.debug("Removing unused SSM coordinator: %s", key)
+                del self._users[key]
+                coordinator = self._coordinators.pop(key)
+                self._hass.async_create_task(coordinator.async_shutdown())
+
+
+@callback
+def async_get_coordinators(hass: HomeAssistant) -> SSMCoordinators:
+    """Return the integration-wide coordinator registry."""
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = SSMCoordinators(hass)
+
+    return hass.data[DOMAIN]
@@ -0,0 +1,54 @@
+"""Diagnostics support for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401, R0903
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry  # type: ignore
+from homeassistant.core import HomeAssistant  # type: ignore
+
+from .coordinator import async_get_coordinators
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinators = async_get_coordinators(hass)
+    client = coordinators.client
+
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinators": {
+            coordinator.name: {
+                "last_update_success": coordinator.last_update_success,
+                "last_exception": (
+                    repr(coordinator.last_exception)
+                    if coordinator.last_exception is not None
+                    else None
+                ),
+                "update_interval": (
+                    coordinator.update_interval.total_seconds()
+                    if coordinator.update_interval is not None
+                    else None
+                ),
+                "traces": [asdict(trace) for trace in coordinator.traces],
+            }
+            for coordinator in coordinators.entry_coordinators(entry.entry_id)
+        },
+        "entities": {
+            source: [asdict(trace) for trace in traces]
+            for source, traces in coordinators.entry_traces(entry.entry_id).items()
+        },
+        "request_queue": client.limiter.stats,
+        "endpoints": {
+            endpoint: metrics.as_dict() for endpoint, metrics in client.metrics.items()
+        },
+        "cache": coordinators.cache.as_diagnostics(),
+    }
@@ -0,0 +1,52 @@
+"""Entity helpers for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401
+
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry  # type: ignore
+from homeassistant.helpers.device_registry import (  # type: ignore
+    DeviceEntryType,
+    DeviceInfo,
+)
+
+from .const import DOMAIN, MANUFACTURER, MODEL
+
+
+def entry_string_value(
+    config_entry: ConfigEntry,
+    key: str,
+    default: str | None = None,
+) -> str | None:
+    """Return a config entry option or data value as a string."""
+    value = config_entry.options.get(key, config_entry.data.get(key, default))
+
+    if value is None:
+        return default
+
+    return str(value)
+
+
+def entry_bool_value(config_entry: ConfigEntry, key: str) -> bool:
+    """Return a config entry option or data flag."""
+    return bool(config_entry.options.get(key, config_entry.data.get(key, False)))
+
+
+def device_info(entry_id: str, name: str) -> DeviceInfo:
+    """Return device info used by all SSM entities."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry_id)},
+        name=name,
+        manufacturer=MANUFACTURER,
+        model=MODEL,
+    )
+
+
+def service_device_info() -> DeviceInfo:
+    """Return device info for the integration-wide diagnostic entities."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, "api")},
+        name="SSM API",
+        manufacturer=MANUFACTURER,
+        entry_type=DeviceEntryType.SERVICE,
+    )
@@ -0,0 +1,180 @@
+"""Compact sample storage for the Swedish Radiation Safety Authority integration."""
+
+from __future__ import annotations
+
+import bisect
+import math
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class WindowStats:
+    """Aggregates of the samples in a time window."""
+
+    count: int
+    latest: float
+    minimum: float
+    maximum: float
+    mean: float
+
+
+class SampleRingBuffer:
+    """Fixed-capacity ring of (Unix milliseconds, value) samples, oldest first.
+
+    Timestamps and values live in preallocated parallel arrays, 16 bytes per
+    sample, so memory does not grow with retention. Samples must arrive in
+    time order; when the ring is full, appending drops the oldest sample.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty ring."""
+        self._capacity = max(capacity, 1)
+        self._timestamps = array("q", bytes(8 * self._capacity))
+        self._values = array("d", bytes(8 * self._capacity))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of stored samples."""
+        return self._capacity
+
+    @property
+    def full(self) -> bool:
+        """Return if the next append drops the oldest sample."""
+        return self._size == self._capacity
+
+    @property
+    def first(self) -> tuple[int, float] | None:
+        """Return the oldest sample."""
+        if not self._size:
+            return None
+
+        return self._timestamps[self._start], self._values[self._start]
+
+    @property
+    def last_timestamp(self) -> int | None:
+        """Return the newest sample timestamp in Unix milliseconds."""
+        if not self._size:
+            return None
+
+        return self._timestamps[(self._start + self._size - 1) % self._capacity]
+
+    def _segments(self) -> list[tuple[int, int]]:
+        """Return the physical index ranges of the samples, oldest first."""
+        end = self._start + self._size
+        if end <= self._capacity:
+            return [(self._start, end)]
+
+        return [(self._start, self._capacity), (0, end - self._capacity)]
+
+    def append(self, timestamp: int, value: float) -> bool:
+        """Add a sample newer than the newest one and return if it was added."""
+        last_timestamp = self.last_timestamp
+        if last_timestamp is not None and timestamp <= last_timestamp:
+            return False
+
+        index = (self._start + self._size) % self._capacity
+        self._timestamps[index] = timestamp
+        self._values[index] = value
+
+        if self._size < self._capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self._capacity
+
+        return True
+
+    def extend(self, samples: Iterable[tuple[int, float]]) -> int:
+        """Add time-ordered samples newer than the newest one; return how many."""
+        return sum(self.append(timestamp, value) for timestamp, value in samples)
+
+    def popleft(self) -> tuple[int, float]:
+        """Remove and return the oldest sample."""
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+
+        sample = self._timestamps[self._start], self._values[self._start]
+        self._start = (self._start + 1) % self._capacity
+        self._size -= 1
+        return sample
+
+    def window(self, start: int, end: int) -> WindowStats | None:
+        """Return aggregates of samples with start <= timestamp <= end.
+
+        The range is found by bisection and aggregated by builtins over
+        memoryviews of the stored values, so no values are copied.
+        """
+        count = 0
+        total = 0.0
+        minimum = math.inf
+        maximum = -math.inf
+        latest = 0.0
+
+        with memoryview(self._values) as values:
+            for low, high in self._segments():
+                first = bisect.bisect_left(self._timestamps, start, low, high)
+                last = bisect.bisect_right(self._timestamps, end, low, high)
+                if first >= last:
+                    continue
+
+                with values[first:last] as view:
+                    total += sum(view)
+                    minimum = min(minimum, *view)
+                    maximum = max(maximum, *view)
+
+                count += last - first
+                latest = values[last - 1]
+
+        if not count:
+            return None
+
+        return WindowStats(
+            count=count,
+            latest=latest,
+            minimum=minimum,
+            maximum=maximum,
+            mean=total / count,
+        )
+
+    def since(self, start: int) -> list[tuple[int, float]]:
+        """Return the samples with timestamp >= start, oldest first."""
+        samples: list[tuple[int, float]] = []
+
+        for low, high in self._segments():
+            first = bisect.bisect_left(self._timestamps, start, low, high)
+            samples.extend(
+                (self._timestamps[index], self._values[index])
+                for index in range(first, high)
+            )
+
+        return samples
+
+    def samples(self) -> list[tuple[int, float]]:
+        """Return all stored samples as (Unix milliseconds, value) pairs."""
+        return [
+            (self._timestamps[index], self._values[index])
+            for low, high in self._segments()
+            for index in range(low, high)
+        ]
+
+    def columns(self) -> tuple[list[int], list[float]]:
+        """Return all timestamps and all values as two lists, oldest first.
+
+        This is the compact form for storage: two flat lists copied from the
+        arrays instead of one tuple per sample.
+        """
+        timestamps: list[int] = []
+        values: list[float] = []
+
+        for low, high in self._segments():
+            timestamps.extend(self._timestamps[low:high].tolist())
+            values.extend(self._values[low:high].tolist())
+
+        return timestamps, values
@@ -0,0 +1,167 @@
+"""Streaming rolling-window statistics for the Swedish Radiation Safety Authority integration."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import timedelta
+from typing import Any
+
+from .ring_buffer import SampleRingBuffer
+
+# Percentiles come from a fixed histogram over 0-1 μSv/h; higher values fall
+# into the last bin. Background radiation in Sweden stays well below that.
+_HISTOGRAM_BINS = 500
+_HISTOGRAM_MAX = 1.0
+_BIN_WIDTH = _HISTOGRAM_MAX / _HISTOGRAM_BINS
+
+
+class RollingWindow:
+    """Statistics over the samples of the last span, updated one at a time.
+
+    Mean and variance use Welford's method, which can also remove samples.
+    Minimum and maximum use monotonic deques and percentiles a fixed-size
+    histogram, so adding or expiring a sample is O(1) amortized. Samples are
+    kept in a ring buffer; if it fills up before samples expire, the oldest
+    sample is removed early.
+    """
+
+    def __init__(self, span: timedelta, capacity: int) -> None:
+        """Initialize an empty window."""
+        self._span_ms = int(span.total_seconds() * 1000)
+        self._samples = SampleRingBuffer(capacity)
+        self._minimums: deque[tuple[int, float]] = deque()
+        self._maximums: deque[tuple[int, float]] = deque()
+        self._histogram = [0] * _HISTOGRAM_BINS
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    @staticmethod
+    def _bin(value: float) -> int:
+        """Return the histogram bin for a value."""
+        return max(0, min(int(value / _BIN_WIDTH), _HISTOGRAM_BINS - 1))
+
+    def add(self, timestamp: int, value: float) -> None:
+        """Add a sample newer than every sample already in the window."""
+        if self._samples.full:
+            self._remove_oldest()
+
+        self._samples.append(timestamp, value)
+
+        count = len(self._samples)
+        delta = value - self._mean
+        self._mean += delta / count
+        self._m2 += delta * (value - self._mean)
+
+        while self._minimums and self._minimums[-1][1] >= value:
+            self._minimums.pop()
+        self._minimums.append((timestamp, value))
+
+        while self._maximums and self._maximums[-1][1] <= value:
+            self._maximums.pop()
+        self._maximums.append((timestamp, value))
+
+        self._histogram[self._bin(value)] += 1
+
+        self._expire(timestamp - self._span_ms)
+
+    def _expire(self, before: int) -> None:
+        """Remove samples older than a Unix millisecond timestamp."""
+        while (first := self._samples.first) is not None and first[0] < before:
+            self._remove_oldest()
+
+    def _remove_oldest(self) -> None:
+        """Remove the oldest sample from every aggregate."""
+        timestamp, value = self._samples.popleft()
+
+        count = len(self._samples)
+        if count:
+            delta = value - self._mean
+            self._mean -= delta / count
+            self._m2 = max(self._m2 - delta * (value - self._mean), 0.0)
+        else:
+            self._mean = 0.0
+            self._m2 = 0.0
+
+        if self._minimums[0][0] == timestamp:
+            self._minimums.popleft()
+        if self._maximums[0][0] == timestamp:
+            self._maximums.popleft()
+
+        self._histogram[self._bin(value)] -= 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the approximate value below which a percentage of samples fall."""
+        count = len(self._samples)
+        if not count:
+            return None
+
+        rank = max(math.ceil(count * percent / 100), 1)
+        seen = 0
+        for index, bin_count in enumerate(self._histogram):
+            seen += bin_count
+            if seen >= rank:
+                return (index + 0.5) * _BIN_WIDTH
+
+        return _HISTOGRAM_MAX
+
+    def stats(self) -> dict[str, Any]:
+        """Return the window statistics in μSv/h."""
+        count = len(self._samples)
+        if not count:
+            return {"count": 0}
+
+        return {
+            "count": count,
+            "mean": self._mean,
+            "stdev": math.sqrt(self._m2 / (count - 1)) if count > 1 else 0.0,
+            "min": self._minimums[0][1],
+            "max": self._maximums[0][1],
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+        }
+
+    def columns(self) -> tuple[list[int], list[float]]:
+        """Return the timestamps and values in the window, oldest first."""
+        return self._samples.columns()
+
+
+class RollingStatistics:
+    """Rolling windows of several spans fed from the same sample stream."""
+
+    def __init__(self, windows: dict[str, timedelta], min_interval: timedelta) -> None:
+        """Initialize one empty window per span, sized for the sample interval."""
+        self._windows = {
+            name: RollingWindow(span, int(span / min_interval))
+            for name, span in windows.items()
+        }
+        self._longest = max(windows, key=windows.__getitem__)
+        self._last_timestamp: int | None = None
+
+    def add(self, samples: list[tuple[int, float]]) -> int:
+        """Add samples newer than the last one seen and return how many."""
+        added = 0
+
+        for timestamp, value in samples:
+            if self._last_timestamp is not None and timestamp <= self._last_timestamp:
+                continue
+
+            for window in self._windows.values():
+                window.add(timestamp, value)
+
+            self._last_timestamp = timestamp
+            added += 1
+
+        return added
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of every window in μSv/h."""
+        return {name: window.stats() for name, window in self._windows.items()}
+
+    def columns(self) -> tuple[list[int], list[float]]:
+        """Return the timestamps and values of the longest window, oldest first."""
+        return self._windows[self._longest].columns()
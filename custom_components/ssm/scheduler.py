@@ -0,0 +1,110 @@
+"""Adaptive polling for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=R0902
+
+from __future__ import annotations
+
+import logging
+import statistics
+from collections import deque
+from datetime import datetime, timedelta
+
+_LOGGER = logging.getLogger(__name__)
+
+_HISTORY_SIZE = 8
+
+
+class AdaptivePollScheduler:
+    """Learn when a source publishes new data and choose the next poll.
+
+    The cadence is the median gap between newly published samples and the
+    lag is the median delay before a published sample shows up in the API.
+    Polls are aimed just after the next sample is expected; while responses
+    stay unchanged past that point, the interval backs off exponentially.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        default_interval: timedelta,
+        min_interval: timedelta,
+        max_interval: timedelta,
+        margin: timedelta,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._name = name
+        self._default_interval = default_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._margin = margin
+        self._gaps: deque[float] = deque(maxlen=_HISTORY_SIZE)
+        self._lags: deque[float] = deque(maxlen=_HISTORY_SIZE)
+        self._last_published: datetime | None = None
+        self._last_poll: datetime | None = None
+        self._unchanged_polls = 0
+
+    @property
+    def cadence(self) -> timedelta | None:
+        """Return the learned publish cadence."""
+        if not self._gaps:
+            return None
+
+        return timedelta(seconds=statistics.median(self._gaps))
+
+    @property
+    def lag(self) -> timedelta:
+        """Return the learned delay between publishing and availability."""
+        if not self._lags:
+            return timedelta()
+
+        return timedelta(seconds=statistics.median(self._lags))
+
+    def observe(self, now: datetime, published: datetime | None) -> None:
+        """Record a poll and the timestamp of its newest data.
+
+        Pass the same timestamp as last time, or None, when nothing changed.
+        """
+        if published is None or published == self._last_published:
+            self._unchanged_polls += 1
+        else:
+            if self._last_published is not None and published > self._last_published:
+                self._gaps.append((published - self._last_published).total_seconds())
+
+                # The sample appeared some time between the previous poll and
+                # this one; the midpoint is the best estimate of when.
+                seen = now
+                if self._last_poll is not None:
+                    seen = self._last_poll + (now - self._last_poll) / 2
+                self._lags.append(max((seen - published).total_seconds(), 0.0))
+
+            self._last_published = published
+            self._unchanged_polls = 0
+
+        self._last_poll = now
+
+    def next_interval(self, now: datetime) -> timedelta:
+        """Return how long to wait before the next poll."""
+        cadence = self.cadence
+        if cadence is None or self._last_published is None:
+            return self._default_interval
+
+        expected = self._last_published + cadence + self.lag + self._margin
+
+        if expected > now:
+            interval = expected - now
+        else:
+            # Data is late: poll again soon, backing off while it stays late.
+            interval = self._min_interval * 2 ** min(self._unchanged_polls, 8)
+
+        interval = max(self._min_interval, min(interval, self._max_interval))
+
+        _LOGGER.debug(
+            "Next %s poll in %s (cadence %s, lag %s, %s unchanged polls)",
+            self._name,
+            interval,
+            cadence,
+            self.lag,
+            self._unchanged_polls,
+        )
+
+        return interval
@@ -4,44 +4,80 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Any
-from urllib.parse import quote
-from zoneinfo import ZoneInfo
+from typing import Any, Generic, TypeVar
 
-from aiohttp import ClientError, ClientSession  # type: ignore
+from aiohttp import ClientError  # type: ignore
 from homeassistant.components.sensor import (  # type: ignore
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry  # type: ignore
-from homeassistant.const import CONF_NAME, UnitOfTime  # type: ignore
-from homeassistant.core import HomeAssistant  # type: ignore
-from homeassistant.helpers.aiohttp_client import async_get_clientsession  # type: ignore
-from homeassistant.helpers.device_registry import DeviceInfo  # type: ignore
+from homeassistant.const import CONF_NAME, EntityCategory, UnitOfTime  # type: ignore
+from homeassistant.core import HomeAssistant, callback  # type: ignore
 from homeassistant.helpers.entity_platform import (  # type: ignore
     AddConfigEntryEntitiesCallback,
 )
-
+from homeassistant.helpers.event import async_track_time_change  # type: ignore
+from homeassistant.helpers.update_coordinator import CoordinatorEntity  # type: ignore
+
+from .api import (
+    ENDPOINT_RADIATION,
+    ENDPOINT_SUN_TIME,
+    ENDPOINT_SUN_TIME_INDEX,
+    ENDPOINT_UV_INDEX,
+    ENDPOINTS,
+    RadiationData,
+    RequestLimiter,
+    SSMApiClient,
+    UVIndexData,
+)
+from .cache import SSMCache
 from .const import (
+    CACHE_TTL_SUN_TIME,
+    CONF_ALL_LOCATIONS,
+    CONF_ALL_STATIONS,
     CONF_LOCATION,
     CONF_SKIN_TYPE,
     CONF_STATION,
     DOMAIN,
     LOCATIONS,
-    MANUFACTURER,
-    MODEL,
-    RADIATION_HISTORY_URL,
-    SUN_TIME_CALCULATE_URL,
-    SUN_TIME_CALCULATE_WITH_INDEX_URL,
-    UV_INDEX_URL,
+    STATIONS,
+    STOCKHOLM_TIMEZONE,
+)
+from .coordinator import (
+    MemberResult,
+    SSMDataUpdateCoordinator,
+    SSMNetworkCoordinator,
+    SSMRadiationCoordinator,
+    SSMUVIndexCoordinator,
+    SSMUVIndexNetworkCoordinator,
+    async_get_coordinators,
+)
+from .entity import (
+    device_info,
+    entry_bool_value,
+    entry_string_value,
+    service_device_info,
 )
+from .sun_time import SSMSunTimeIndexTable, SSMSunTimeLocationTable
+from .tracing import TraceBuffer, record_branch, trace_update
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(minutes=30)
-STOCKHOLM_TIMEZONE = ZoneInfo("Europe/Stockholm")
+_CoordinatorT = TypeVar("_CoordinatorT", bound=SSMDataUpdateCoordinator[Any])
+
+# Only the diagnostic request sensors poll; data sensors use coordinators.
+SCAN_INTERVAL = timedelta(minutes=1)
+
+ENDPOINT_NAMES = {
+    ENDPOINT_RADIATION: "Radiation API",
+    ENDPOINT_UV_INDEX: "UV index API",
+    ENDPOINT_SUN_TIME: "Sun time API",
+    ENDPOINT_SUN_TIME_INDEX: "Sun time index API",
+}
 
 
 async def async_setup_entry(
@@ -50,47 +86,113 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up SSM sensors based on a config entry."""
-    name = _entry_string_value(config_entry, CONF_NAME, "SSM") or "SSM"
-    station = _entry_string_value(config_entry, CONF_STATION)
-    location = _entry_string_value(config_entry, CONF_LOCATION)
-    skin_type = _entry_string_value(config_entry, CONF_SKIN_TYPE)
+    name = entry_string_value(config_entry, CONF_NAME, "SSM") or "SSM"
+    station = entry_string_value(config_entry, CONF_STATION)
+    location = entry_string_value(config_entry, CONF_LOCATION)
+    skin_type = entry_string_value(config_entry, CONF_SKIN_TYPE)
 
-    session = async_get_clientsession(hass)
+    coordinators = async_get_coordinators(hass)
     entities: list[SensorEntity] = []
 
-    if station:
+    if entry_bool_value(config_entry, CONF_ALL_STATIONS):
+        network = coordinators.radiation_network(config_entry.entry_id)
+        network.async_start()
+        entities.extend(
+            SSMNetworkRadiationSensor(
+                coordinator=network,
+                station=network_station["id"],
+                station_name=network_station["name"],
+                name=name,
+                entry_id=config_entry.entry_id,
+            )
+            for network_station in STATIONS
+        )
+    elif station:
+        radiation_coordinator = coordinators.radiation(station, config_entry.entry_id)
+        radiation_coordinator.async_start()
         entities.append(
             SSMRadiationSensor(
-                session=session,
+                coordinator=radiation_coordinator,
                 name=name,
-                station=station,
                 entry_id=config_entry.entry_id,
             )
         )
 
-    if location:
-        uv_sensor = SSMUVIndexSensor(
-            session=session,
-            name=name,
-            location=location,
-            entry_id=config_entry.entry_id,
+    api_location = _get_api_location_name(location) if location else None
+    if location and api_location is None:
+        _LOGGER.error("API location not found for location: %s", location)
+
+    if entry_bool_value(config_entry, CONF_ALL_LOCATIONS):
+        uv_network = coordinators.uv_index_network(config_entry.entry_id)
+        uv_network.async_start()
+
+        for network_location in LOCATIONS:
+            entities.append(
+                SSMNetworkUVIndexSensor(
+                    coordinator=uv_network,
+                    location=network_location["id"],
+                    location_name=network_location["name"],
+                    name=name,
+                    entry_id=config_entry.entry_id,
+                )
+            )
+
+            if skin_type and "sun_time_latitude" in network_location:
+                entities.append(
+                    SSMNetworkSunTimeSensor(
+                        cache=coordinators.cache,
+                        index_table=coordinators.sun_time_index,
+                        location_table=coordinators.sun_time_location,
+                        traces=coordinators.entity_traces(
+                            config_entry.entry_id,
+                            f"sun_time/{network_location['id']}",
+                        ),
+                        name=name,
+                        skin_type=skin_type,
+                        uv_coordinator=uv_network,
+                        location=network_location["id"],
+                        location_name=network_location["name"],
+                        entry_id=config_entry.entry_id,
+                    )
+                )
+    elif location and api_location:
+        uv_coordinator = coordinators.uv_index(api_location, config_entry.entry_id)
+        uv_coordinator.async_start()
+        entities.append(
+            SSMUVIndexSensor(
+                coordinator=uv_coordinator,
+                name=name,
+                entry_id=config_entry.entry_id,
+            )
         )
-        entities.append(uv_sensor)
 
         if skin_type:
             entities.append(
                 SSMSunTimeSensor(
-                    session=session,
+                    cache=coordinators.cache,
+                    index_table=coordinators.sun_time_index,
+                    location_table=coordinators.sun_time_location,
+                    traces=coordinators.entity_traces(
+                        config_entry.entry_id, f"sun_time/{location}"
+                    ),
                     name=name,
                     skin_type=skin_type,
-                    uv_sensor=uv_sensor,
+                    uv_coordinator=uv_coordinator,
                     location=location,
                     entry_id=config_entry.entry_id,
                 )
             )
 
-    if entities:
-        async_add_entities(entities, update_before_add=True)
+    # The request queue and endpoint metrics are shared by every entry, so
+    # only one entry provides their sensors.
+    if coordinators.claim_diagnostics(config_entry.entry_id):
+        entities.append(SSMRequestQueueSensor(limiter=coordinators.client.limiter))
+        entities.extend(
+            SSMEndpointMetricsSensor(client=coordinators.client, endpoint=endpoint)
+            for endpoint in ENDPOINTS
+        )
+
+    async_add_entities(entities)
 
 
 def _last_updated_iso() -> str:
@@ -98,205 +200,144 @@ def _last_updated_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
-def _entry_string_value(
-    config_entry: ConfigEntry,
-    key: str,
-    default: str | None = None,
-) -> str | None:
-    """Return a config entry option or data value as a string."""
-    value = config_entry.options.get(key, config_entry.data.get(key, default))
-
-    if value is None:
-        return default
-
-    return str(value)
-
-
-def _to_number(value: Any) -> int | float | None:
-    """Convert a value to int or float if possible."""
-    if value is None or isinstance(value, bool):
-        return None
+def _get_api_location_name(location_id: str) -> str | None:
+    """Get the API location name for a given location ID."""
+    location = next((loc for loc in LOCATIONS if loc["id"] == location_id), None)
+    return location["api_name"] if location else None
 
-    if isinstance(value, (int, float)):
-        return value
-
-    if isinstance(value, str):
-        value = value.strip()
-        if not value:
-            return None
-
-        try:
-            number = float(value)
-        except ValueError:
-            return None
-
-        if number.is_integer():
-            return int(number)
-
-        return number
-
-    return None
-
-
-def _device_info(entry_id: str, name: str) -> DeviceInfo:
-    """Return device info used by all SSM sensors."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, entry_id)},
-        name=name,
-        manufacturer=MANUFACTURER,
-        model=MODEL,
-    )
 
-
-class SSMRadiationSensor(SensorEntity):
-    """Representation of a SSM Radiation Sensor."""
+class SSMRadiationSensorBase(CoordinatorEntity[_CoordinatorT], SensorEntity):
+    """Radiation level state shared by the station and network sensors."""
 
     _attr_has_entity_name = True
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "nSv/h"
     _attr_icon = "mdi:radioactive"
     _attr_translation_key = "radiation_level"
-    _unrecorded_attributes = frozenset({"last_updated"})
+    _unrecorded_attributes = frozenset({"last_updated", "rolling_statistics"})
 
     def __init__(
         self,
-        session: ClientSession,
+        coordinator: _CoordinatorT,
         name: str,
-        station: str,
         entry_id: str,
     ) -> None:
         """Initialize the sensor."""
-        self._session = session
-        self._station = station
+        super().__init__(coordinator)
 
         self._attr_name = "Radiation Level"
         self._attr_unique_id = f"{entry_id}_radiation"
         self._attr_native_value: int | float | None = None
-        self._attr_available = True
-        self._attr_device_info = _device_info(entry_id, name)
+        self._attr_device_info = device_info(entry_id, name)
         self._attr_extra_state_attributes: dict[str, Any] = {
             "min_level": None,
             "max_level": None,
             "avg_level": None,
+            "rolling_statistics": {},
             "last_updated": None,
         }
+        self._update_from_coordinator()
+
+    def _radiation_data(self) -> RadiationData | None:
+        """Return the station data shown by this sensor."""
+        raise NotImplementedError
+
+    def _update_from_coordinator(self) -> None:
+        """Copy the shared station data into the entity state."""
+        data = self._radiation_data()
+        if data is None:
+            return
+
+        # API values are μSv/h. Sensor exposes nSv/h.
+        self._attr_native_value = round(data.latest * 1000)
+        self._attr_extra_state_attributes["min_level"] = round(data.minimum * 1000)
+        self._attr_extra_state_attributes["max_level"] = round(data.maximum * 1000)
+        self._attr_extra_state_attributes["avg_level"] = round(data.average * 1000)
+        self._attr_extra_state_attributes["rolling_statistics"] = {
+            window: {
+                key: value if key == "count" or value is None else round(value * 1000)
+                for key, value in stats.items()
+            }
+            for window, stats in data.rolling.items()
+        }
+        self._attr_extra_state_attributes["last_updated"] = data.last_updated
 
-    async def async_update(self) -> None:
-        """Get the latest data from the API and update the state."""
-        now = datetime.now(STOCKHOLM_TIMEZONE)
-        is_dst = bool(now.dst())
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
-        def get_time_range(strategy: str) -> tuple[int, int]:
-            """Return query time range in Unix milliseconds."""
-            end = now.replace(minute=0, second=0, microsecond=0)
 
-            if strategy == "normal":
-                start = end - timedelta(hours=3 if is_dst else 2)
-            elif strategy == "fallback":
-                start = end - timedelta(hours=4 if is_dst else 3)
-            elif strategy == "midnight":
-                start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            else:
-                raise ValueError(f"Unknown strategy: {strategy}")
+class SSMRadiationSensor(SSMRadiationSensorBase[SSMRadiationCoordinator]):
+    """Representation of a SSM Radiation Sensor."""
 
-            _LOGGER.debug(
-                "Query window for Radiation API (%s): %s to %s",
-                strategy,
-                start,
-                end,
-            )
+    def _radiation_data(self) -> RadiationData | None:
+        """Return the station data shown by this sensor."""
+        return self.coordinator.data
 
-            return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
 
-        try:
-            for strategy in ("normal", "fallback", "midnight"):
-                start_timestamp, end_timestamp = get_time_range(strategy)
-
-                url = (
-                    f"{RADIATION_HISTORY_URL}"
-                    f"?locationId={self._station}"
-                    f"&start={start_timestamp}"
-                    f"&end={end_timestamp}"
-                )
+class SSMNetworkRadiationSensor(SSMRadiationSensorBase[SSMNetworkCoordinator]):
+    """Representation of one station of the whole radiation network."""
 
-                _LOGGER.debug("Sending request to Radiation API: %s", url)
-
-                async with self._session.get(url) as response:
-                    if response.status != 200:
-                        _LOGGER.debug(
-                            "Failed to fetch radiation data from SSM API: %s",
-                            response.status,
-                        )
-                        continue
+    _unrecorded_attributes = frozenset(
+        {
+            "last_updated",
+            "rolling_statistics",
+            "fetch_duration",
+            "network_refresh_duration",
+        }
+    )
 
-                    data = await response.json()
-                    _LOGGER.debug("Received response from Radiation API: %s", data)
+    def __init__(
+        self,
+        coordinator: SSMNetworkCoordinator,
+        station: str,
+        station_name: str,
+        name: str,
+        entry_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self._station = station
+        super().__init__(coordinator, name, entry_id)
 
-                values = data.get("values")
-                if not values:
-                    _LOGGER.debug(
-                        "No radiation values received from SSM Radiation API: %s",
-                        data,
-                    )
-                    continue
-
-                radiation_values = [
-                    item[1]
-                    for item in values
-                    if isinstance(item, (list, tuple)) and len(item) > 1
-                ]
-
-                if not radiation_values:
-                    _LOGGER.debug(
-                        "Invalid radiation values received from SSM Radiation API: %s",
-                        data,
-                    )
-                    continue
-
-                valid_values = [
-                    float(value)
-                    for value in (_to_number(value) for value in radiation_values)
-                    if value is not None
-                ]
-
-                if not valid_values:
-                    _LOGGER.debug(
-                        "No valid numeric radiation values from Radiation API: %s",
-                        radiation_values,
-                    )
-                    continue
-
-                # API values are μSv/h. Sensor exposes nSv/h.
-                latest_value: float = valid_values[-1]
-                min_value: float = min(valid_values)
-                max_value: float = max(valid_values)
-                avg_value: float = sum(valid_values) / len(valid_values)
-
-                self._attr_native_value = round(latest_value * 1000)
-                self._attr_extra_state_attributes["min_level"] = round(min_value * 1000)
-                self._attr_extra_state_attributes["max_level"] = round(max_value * 1000)
-                self._attr_extra_state_attributes["avg_level"] = round(avg_value * 1000)
-                self._attr_extra_state_attributes["last_updated"] = _last_updated_iso()
-                self._attr_available = True
-                return
+        self._attr_name = f"Radiation Level {station_name}"
+        self._attr_unique_id = f"{entry_id}_radiation_{station}"
 
-            _LOGGER.warning(
-                "Failed to retrieve valid radiation data after all fallback attempts."
-            )
-            self._attr_available = False
-
-        except (ClientError, TimeoutError, ValueError, KeyError, TypeError) as error:
-            _LOGGER.warning("Error updating SSM Radiation sensor: %s", error)
-            self._attr_available = False
-        except Exception as error:
-            _LOGGER.exception(
-                "Unexpected error updating SSM Radiation sensor: %s", error
-            )
-            self._attr_available = False
+    @property
+    def available(self) -> bool:
+        """Return if the station's last refresh succeeded."""
+        result = self._result()
+        return super().available and result is not None and result.success
+
+    def _result(self) -> MemberResult | None:
+        """Return the network result for this station."""
+        results = self.coordinator.data
+        return results.get(self._station) if results is not None else None
+
+    def _radiation_data(self) -> RadiationData | None:
+        """Return the station data from the network results."""
+        result = self._result()
+        return result.data if result is not None else None
+
+    def _update_from_coordinator(self) -> None:
+        """Copy the station data and refresh timings into the entity state."""
+        super()._update_from_coordinator()
+
+        result = self._result()
+        duration = result.duration if result is not None else None
+        network_duration = self.coordinator.last_refresh_duration
+
+        self._attr_extra_state_attributes["fetch_duration"] = (
+            round(duration, 3) if duration is not None else None
+        )
+        self._attr_extra_state_attributes["network_refresh_duration"] = (
+            round(network_duration, 3) if network_duration is not None else None
+        )
 
 
-class SSMUVIndexSensor(SensorEntity):
-    """Representation of a SSM UV Index Sensor."""
+class SSMUVIndexSensorBase(CoordinatorEntity[_CoordinatorT], SensorEntity):
+    """UV index state shared by the location and network sensors."""
 
     _attr_has_entity_name = True
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -305,17 +346,18 @@ class SSMUVIndexSensor(SensorEntity):
     _unrecorded_attributes = frozenset({"hourly_forecast", "last_updated"})
 
     def __init__(
-        self, session: ClientSession, name: str, location: str, entry_id: str
+        self,
+        coordinator: _CoordinatorT,
+        name: str,
+        entry_id: str,
     ) -> None:
         """Initialize the sensor."""
-        self._session = session
-        self._location = location
+        super().__init__(coordinator)
 
         self._attr_name = "UV Index"
         self._attr_unique_id = f"{entry_id}_uv_index"
         self._attr_native_value: int | float | None = None
-        self._attr_available = True
-        self._attr_device_info = _device_info(entry_id, name)
+        self._attr_device_info = device_info(entry_id, name)
         self._attr_extra_state_attributes: dict[str, Any] = {
             "current_uv": None,
             "max_uv_today": None,
@@ -325,11 +367,12 @@ class SSMUVIndexSensor(SensorEntity):
             "risk_level": None,
             "last_updated": None,
         }
+        self._update_from_coordinator()
 
     @property
-    def current_uv(self) -> int | float | None:
-        """Return current UV index."""
-        return _to_number(self._attr_extra_state_attributes.get("current_uv"))
+    def available(self) -> bool:
+        """Return if the current hour has a UV index value."""
+        return super().available and self._attr_native_value is not None
 
     @staticmethod
     def _get_risk_level(uv_index: int | float) -> str:
@@ -361,156 +404,192 @@ class SSMUVIndexSensor(SensorEntity):
             return "mdi:weather-sunny-off"
         return "mdi:weather-night"
 
-    @staticmethod
-    def _get_api_location_name(location_id: str) -> str | None:
-        """Get the API location name for a given location ID."""
-        location = next((loc for loc in LOCATIONS if loc["id"] == location_id), None)
-        return location["api_name"] if location else None
+    def _uv_data(self) -> UVIndexData | None:
+        """Return the location forecast shown by this sensor."""
+        raise NotImplementedError
 
-    async def async_update(self) -> None:
-        """Get the latest data from the API and update the state."""
-        try:
-            now = datetime.now(STOCKHOLM_TIMEZONE)
-            offset = "-2" if now.dst() else "-1"
+    def _update_from_coordinator(self) -> None:
+        """Copy the shared location forecast into the entity state."""
+        data = self._uv_data()
+        if data is None:
+            return
 
-            api_location = self._get_api_location_name(self._location)
-            if api_location is None:
-                _LOGGER.error("API location not found for location: %s", self._location)
-                self._attr_available = False
-                return
+        current_hour = datetime.now(STOCKHOLM_TIMEZONE).hour
+        current_uv = data.uv_index_at(current_hour)
 
-            encoded_location = quote(api_location, safe="")
-            url = f"{UV_INDEX_URL.format(location=encoded_location)}?offset={offset}"
+        if current_uv is None:
+            _LOGGER.error(
+                "UV hourly data does not contain current hour %s: %s",
+                current_hour,
+                data.hourly_uv_index,
+            )
 
-            _LOGGER.debug("Sending request to UV Index API: %s", url)
+        self._attr_native_value = current_uv
+        self._attr_extra_state_attributes["current_uv"] = current_uv
+        self._attr_extra_state_attributes["max_uv_today"] = data.max_uv_today
+        self._attr_extra_state_attributes["max_uv_time"] = data.max_uv_time
+        self._attr_extra_state_attributes["max_uv_tomorrow"] = data.max_uv_tomorrow
+        self._attr_extra_state_attributes["hourly_forecast"] = data.hourly_forecast
+        self._attr_extra_state_attributes["risk_level"] = self._get_risk_level(
+            data.max_uv_today
+        )
+        self._attr_extra_state_attributes["last_updated"] = data.last_updated
 
-            async with self._session.get(url) as response:
-                if response.status != 200:
-                    _LOGGER.error(
-                        "Failed to fetch UV index data from SSM API: %s",
-                        response.status,
-                    )
-                    self._attr_available = False
-                    return
+        if current_uv is not None:
+            self._attr_icon = self._get_icon(current_uv)
 
-                data = await response.json()
-                _LOGGER.debug("Received response from UV Index API: %s", data)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
-            location_data = data["response"]["location"]
-            dates = location_data["date"]
 
-            if not dates:
-                _LOGGER.error(
-                    "No UV date data received from SSM UV Index API: %s", data
-                )
-                self._attr_available = False
-                return
-
-            today_data = dates[0]
-            hourly_data = today_data["hourlyUvIndex"]
-
-            current_hour = now.hour
-            if current_hour >= len(hourly_data):
-                _LOGGER.error(
-                    "UV hourly data does not contain current hour %s: %s",
-                    current_hour,
-                    hourly_data,
-                )
-                self._attr_available = False
-                return
+class SSMUVIndexSensor(SSMUVIndexSensorBase[SSMUVIndexCoordinator]):
+    """Representation of a SSM UV Index Sensor."""
 
-            current_uv: int | float | None = _to_number(hourly_data[current_hour])
-            max_uv_today: int | float | None = _to_number(today_data["maxUvIndex"])
+    def _uv_data(self) -> UVIndexData | None:
+        """Return the location forecast shown by this sensor."""
+        return self.coordinator.data
 
-            if current_uv is None or max_uv_today is None:
-                _LOGGER.error(
-                    "Invalid UV values received from SSM UV Index API: %s",
-                    data,
-                )
-                self._attr_available = False
-                return
 
-            max_uv_time = today_data.get("maxUvIndexTime")
-            max_time_formatted: str | None = None
-            if max_uv_time:
-                max_time_obj = datetime.strptime(max_uv_time, "%Y-%m-%dT%H:%M:%S")
-                max_time_formatted = max_time_obj.strftime("%H:%M")
+class SSMNetworkUVIndexSensor(SSMUVIndexSensorBase[SSMUVIndexNetworkCoordinator]):
+    """Representation of one location of the whole UV index catalog."""
 
-            max_uv_tomorrow: int | float | None = None
-            if len(dates) > 1:
-                max_uv_tomorrow = _to_number(dates[1].get("maxUvIndex"))
+    _unrecorded_attributes = frozenset(
+        {"hourly_forecast", "last_updated", "network_refresh_duration"}
+    )
 
-            hourly_forecast = [
-                {
-                    "time": f"{hour:02d}:00",
-                    "uv_index": _to_number(uv),
-                }
-                for hour, uv in enumerate(hourly_data)
-            ]
+    def __init__(
+        self,
+        coordinator: SSMUVIndexNetworkCoordinator,
+        location: str,
+        location_name: str,
+        name: str,
+        entry_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self._location = location
+        super().__init__(coordinator, name, entry_id)
 
-            self._attr_native_value = current_uv
-            self._attr_extra_state_attributes["current_uv"] = current_uv
-            self._attr_extra_state_attributes["max_uv_today"] = max_uv_today
-            self._attr_extra_state_attributes["max_uv_time"] = max_time_formatted
-            self._attr_extra_state_attributes["max_uv_tomorrow"] = max_uv_tomorrow
-            self._attr_extra_state_attributes["hourly_forecast"] = hourly_forecast
-            self._attr_extra_state_attributes["risk_level"] = self._get_risk_level(
-                max_uv_today
-            )
-            self._attr_extra_state_attributes["last_updated"] = _last_updated_iso()
-            self._attr_icon = self._get_icon(current_uv)
-            self._attr_available = True
+        self._attr_name = f"UV Index {location_name}"
+        self._attr_unique_id = f"{entry_id}_uv_index_{location}"
 
-        except (ClientError, TimeoutError, ValueError, KeyError, TypeError) as error:
-            _LOGGER.error("Error updating SSM UV Index sensor: %s", error)
-            self._attr_available = False
-        except Exception as error:
-            _LOGGER.exception(
-                "Unexpected error updating SSM UV Index sensor: %s", error
-            )
-            self._attr_available = False
+    @property
+    def available(self) -> bool:
+        """Return if the location's last refresh succeeded."""
+        result = self._result()
+        return super().available and result is not None and result.success
+
+    def _result(self) -> MemberResult | None:
+        """Return the network result for this location."""
+        results = self.coordinator.data
+        return results.get(self._location) if results is not None else None
+
+    def _uv_data(self) -> UVIndexData | None:
+        """Return the location forecast from the network results."""
+        result = self._result()
+        return result.data if result is not None else None
+
+    def _update_from_coordinator(self) -> None:
+        """Copy the location forecast and refresh timing into the entity state."""
+        super()._update_from_coordinator()
+
+        network_duration = self.coordinator.last_refresh_duration
+        self._attr_extra_state_attributes["network_refresh_duration"] = (
+            round(network_duration, 3) if network_duration is not None else None
+        )
 
 
-class SSMSunTimeSensor(SensorEntity):
-    """Representation of a SSM Min Soltid Sensor."""
+class SSMSunTimeSensorBase(SensorEntity, Generic[_CoordinatorT]):
+    """Min soltid state shared by the location and network sensors."""
 
     _attr_has_entity_name = True
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
     _attr_icon = "mdi:sun-clock"
     _attr_translation_key = "min_soltid"
-    _unrecorded_attributes = frozenset({"last_updated"})
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"hourly_forecast", "last_updated"})
 
     def __init__(
         self,
-        session: ClientSession,
+        cache: SSMCache,
+        index_table: SSMSunTimeIndexTable,
+        location_table: SSMSunTimeLocationTable,
+        traces: TraceBuffer,
         name: str,
         skin_type: str,
-        uv_sensor: SSMUVIndexSensor,
+        uv_coordinator: _CoordinatorT,
         location: str,
         entry_id: str,
     ) -> None:
         """Initialize the sensor."""
-        self._session = session
+        self._cache = cache
+        self._cache_key = f"sun_time/{skin_type}/{location}"
+        self._index_table = index_table
+        self._location_table = location_table
+        self._traces = traces
         self._skin_type = skin_type
-        self._uv_sensor = uv_sensor
+        self._uv_coordinator = uv_coordinator
         self._location = location
+        self._last_inputs: tuple[str, int, int | None] | None = None
 
         self._attr_name = "Min soltid"
         self._attr_unique_id = f"{entry_id}_sun_time"
         self._attr_native_value: int | float | None = None
         self._attr_available = True
-        self._attr_device_info = _device_info(entry_id, name)
+        self._attr_device_info = device_info(entry_id, name)
         self._attr_extra_state_attributes: dict[str, Any] = {
             "shade_direct_sun": None,
             "shade_partial": None,
             "shade_full": None,
+            "hourly_forecast": [],
             "i_shade_direct_sun": None,
             "i_shade_partial": None,
             "i_shade_full": None,
             "last_updated": None,
         }
 
+    async def async_added_to_hass(self) -> None:
+        """Restore the last good values and refresh in the background."""
+        await super().async_added_to_hass()
+
+        cached = self._cache.get(self._cache_key, CACHE_TTL_SUN_TIME)
+        if cached is not None:
+            self._attr_native_value = cached.get("native_value")
+            self._attr_extra_state_attributes.update(cached.get("attributes", {}))
+
+        self.async_on_remove(
+            self._uv_coordinator.async_add_listener(self._async_inputs_changed)
+        )
+        self.async_on_remove(
+            async_track_time_change(
+                self.hass, self._async_inputs_changed, minute=0, second=0
+            )
+        )
+
+        self.async_schedule_update_ha_state(force_refresh=True)
+        self.hass.async_create_background_task(
+            self._index_table.async_prefill(int(self._skin_type)),
+            f"{DOMAIN} sun time prefill {self._skin_type}",
+        )
+
+    def _current_inputs(self, now: datetime) -> tuple[str, int, int | None]:
+        """Return the date, hour and UV index the sun-time values depend on."""
+        return now.date().isoformat(), now.hour, self._get_uv_index(now)
+
+    @callback
+    def _async_inputs_changed(self, _now: datetime | None = None) -> None:
+        """Recalculate when the UV forecast updates or a new hour starts."""
+        inputs = self._current_inputs(datetime.now(STOCKHOLM_TIMEZONE))
+
+        if inputs == self._last_inputs:
+            _LOGGER.debug("Sun time inputs unchanged (%s); skipping update", inputs)
+            return
+
+        self.async_schedule_update_ha_state(force_refresh=True)
+
     @staticmethod
     def _get_sun_time_coordinates(
         location_id: str,
@@ -526,38 +605,29 @@ class SSMSunTimeSensor(SensorEntity):
             location.get("sun_time_longitude"),
         )
 
-    def _get_uv_index(self) -> int | None:
-        """Return the current UV index from the UV sensor."""
-        current_uv = self._uv_sensor.current_uv
+    def _uv_data(self) -> UVIndexData | None:
+        """Return the shared UV forecast for the location."""
+        raise NotImplementedError
+
+    def _get_uv_index(self, now: datetime) -> int | None:
+        """Return the current UV index from the shared UV forecast."""
+        data = self._uv_data()
+        current_uv = data.uv_index_at(now.hour) if data is not None else None
 
         if current_uv is None:
-            _LOGGER.debug("UV index unavailable from UV sensor")
+            _LOGGER.debug("UV index unavailable from UV forecast")
             return None
 
         return int(round(float(current_uv)))
 
-    @staticmethod
-    def _parse_safe_times(
-        results: list[dict[str, Any]],
-    ) -> dict[str, int | float | None]:
-        """Parse safe times from the SSM sun time API response."""
-        safe_times: dict[str, int | float | None] = {
-            "direkt solljus": None,
-            "lite skugga": None,
-            "mycket skugga": None,
-        }
-
-        for item in results:
-            desc = item.get("shadowDescription", "").lower()
-
-            for key in safe_times:
-                if key in desc:
-                    safe_times[key] = _to_number(item.get("safeTime"))
-
-        return safe_times
+    async def _update_from_location_calculation(
+        self,
+        now: datetime,
+    ) -> int | float | None:
+        """Update sun-time values from location/date/hour based calculation.
 
-    async def _update_from_location_calculation(self, now: datetime) -> bool:
-        """Update sun-time values from location/date/hour based calculation."""
+        Return the direct-sun safe time, or None if it is unavailable.
+        """
         latitude, longitude = self._get_sun_time_coordinates(self._location)
 
         if latitude is None or longitude is None:
@@ -569,43 +639,32 @@ class SSMSunTimeSensor(SensorEntity):
             self._attr_extra_state_attributes["shade_direct_sun"] = None
             self._attr_extra_state_attributes["shade_partial"] = None
             self._attr_extra_state_attributes["shade_full"] = None
-            return False
-
-        payload = {
-            "skintypeId": int(self._skin_type),
-            "latitude": latitude,
-            "longitude": longitude,
-            "dateStr": now.strftime("%Y-%m-%d"),
-            "hour": now.hour,
-        }
-
-        _LOGGER.debug("Sending request to Sun Time API (/calculate): %s", payload)
+            return None
 
         try:
-            async with self._session.post(
-                SUN_TIME_CALCULATE_URL,
-                json=payload,
-            ) as response:
-                if response.status != 200:
-                    _LOGGER.warning(
-                        "Failed to fetch Sun Time API (/calculate) response: %s",
-                        response.status,
-                    )
-                    self._attr_extra_state_attributes["shade_direct_sun"] = None
-                    self._attr_extra_state_attributes["shade_partial"] = None
-                    self._attr_extra_state_attributes["shade_full"] = None
-                    return False
-
-                data = await response.json()
-                _LOGGER.debug(
-                    "Received response from Sun Time API (/calculate): %s",
-                    data,
-                )
-
-            safe_times = self._parse_safe_times(
-                data.get("result", {}).get("safeTimeResults", [])
+            hours = await self._location_table.async_get_day(
+                int(self._skin_type), latitude, longitude, now.date()
             )
 
+            self._attr_extra_state_attributes["hourly_forecast"] = [
+                {
+                    "time": f"{hour:02d}:00",
+                    "safe_time": (
+                        hour_times.get("direkt solljus")
+                        if hour_times is not None
+                        else None
+                    ),
+                }
+                for hour, hour_times in enumerate(hours)
+            ]
+
+            safe_times = hours[now.hour]
+            if safe_times is None:
+                self._attr_extra_state_attributes["shade_direct_sun"] = None
+                self._attr_extra_state_attributes["shade_partial"] = None
+                self._attr_extra_state_attributes["shade_full"] = None
+                return None
+
             direct_sun: int | float | None = safe_times.get("direkt solljus")
             partial_shade: int | float | None = safe_times.get("lite skugga")
             full_shade: int | float | None = safe_times.get("mycket skugga")
@@ -613,29 +672,28 @@ class SSMSunTimeSensor(SensorEntity):
             if direct_sun is None:
                 _LOGGER.warning(
                     "Location-based Sun Time API response did not contain "
-                    "direct-sun safe time: %s",
-                    data,
+                    "direct-sun safe time for hour %s: %s",
+                    now.hour,
+                    safe_times,
                 )
                 self._attr_extra_state_attributes["shade_direct_sun"] = None
                 self._attr_extra_state_attributes["shade_partial"] = None
                 self._attr_extra_state_attributes["shade_full"] = None
-                return False
+                return None
 
-            # Main state is location/date/hour based direct-sun safe time.
-            self._attr_native_value = direct_sun
             self._attr_extra_state_attributes["shade_direct_sun"] = direct_sun
             self._attr_extra_state_attributes["shade_partial"] = partial_shade
             self._attr_extra_state_attributes["shade_full"] = full_shade
             self._attr_extra_state_attributes["last_updated"] = _last_updated_iso()
 
-            return True
+            return direct_sun
 
         except (ClientError, TimeoutError, ValueError, KeyError, TypeError) as error:
             _LOGGER.warning("Error calling Sun Time API (/calculate): %s", error)
             self._attr_extra_state_attributes["shade_direct_sun"] = None
             self._attr_extra_state_attributes["shade_partial"] = None
             self._attr_extra_state_attributes["shade_full"] = None
-            return False
+            return None
         except Exception as error:
             _LOGGER.exception(
                 "Unexpected error calling Sun Time API (/calculate): %s",
@@ -644,14 +702,17 @@ class SSMSunTimeSensor(SensorEntity):
             self._attr_extra_state_attributes["shade_direct_sun"] = None
             self._attr_extra_state_attributes["shade_partial"] = None
             self._attr_extra_state_attributes["shade_full"] = None
-            return False
+            return None
 
     async def _update_from_index_calculation(
         self,
-        prefer_as_state: bool,
-    ) -> bool:
-        """Update sun-time values from current UV-index based calculation."""
-        uv_index = self._get_uv_index()
+        now: datetime,
+    ) -> int | float | None:
+        """Update sun-time values from current UV-index based calculation.
+
+        Return the direct-sun safe time, or None if it is unavailable.
+        """
+        uv_index = self._get_uv_index(now)
         if uv_index is None:
             _LOGGER.debug(
                 "Skipping Sun Time API (/calculatewithindex) due to "
@@ -660,70 +721,29 @@ class SSMSunTimeSensor(SensorEntity):
             self._attr_extra_state_attributes["i_shade_direct_sun"] = None
             self._attr_extra_state_attributes["i_shade_partial"] = None
             self._attr_extra_state_attributes["i_shade_full"] = None
-            return False
-
-        payload = {
-            "skintypeId": int(self._skin_type),
-            "uvIndex": uv_index,
-        }
-
-        _LOGGER.debug(
-            "Sending request to Sun Time API (/calculatewithindex): %s",
-            payload,
-        )
+            return None
 
         try:
-            async with self._session.post(
-                SUN_TIME_CALCULATE_WITH_INDEX_URL,
-                json=payload,
-            ) as response:
-                if response.status != 200:
-                    _LOGGER.warning(
-                        "Failed to fetch Sun Time API (/calculatewithindex) "
-                        "response: %s",
-                        response.status,
-                    )
-                    self._attr_extra_state_attributes["i_shade_direct_sun"] = None
-                    self._attr_extra_state_attributes["i_shade_partial"] = None
-                    self._attr_extra_state_attributes["i_shade_full"] = None
-                    return False
-
-                data = await response.json()
-                _LOGGER.debug(
-                    "Received response from Sun Time API (/calculatewithindex): %s",
-                    data,
-                )
-
-            safe_times = self._parse_safe_times(
-                data.get("result", {}).get("safeTimeResults", [])
+            safe_times = await self._index_table.async_get(
+                int(self._skin_type), uv_index
             )
 
-            index_direct_sun: int | float | None = safe_times.get("direkt solljus")
-            index_partial_shade: int | float | None = safe_times.get("lite skugga")
-            index_full_shade: int | float | None = safe_times.get("mycket skugga")
-
-            if index_direct_sun is None:
-                _LOGGER.warning(
-                    "Index-based Sun Time API response did not contain "
-                    "direct-sun safe time: %s",
-                    data,
-                )
+            if safe_times is None:
                 self._attr_extra_state_attributes["i_shade_direct_sun"] = None
                 self._attr_extra_state_attributes["i_shade_partial"] = None
                 self._attr_extra_state_attributes["i_shade_full"] = None
-                return False
+                return None
+
+            index_direct_sun: int | float | None = safe_times.get("direkt solljus")
+            index_partial_shade: int | float | None = safe_times.get("lite skugga")
+            index_full_shade: int | float | None = safe_times.get("mycket skugga")
 
             self._attr_extra_state_attributes["i_shade_direct_sun"] = index_direct_sun
             self._attr_extra_state_attributes["i_shade_partial"] = index_partial_shade
             self._attr_extra_state_attributes["i_shade_full"] = index_full_shade
             self._attr_extra_state_attributes["last_updated"] = _last_updated_iso()
 
-            if prefer_as_state:
-                # Fallback mode: no official sun-time coordinates exist.
-                # Use current-UV-index safe time as the entity state.
-                self._attr_native_value = index_direct_sun
-
-            return True
+            return index_direct_sun
 
         except (ClientError, TimeoutError, ValueError, KeyError, TypeError) as error:
             _LOGGER.warning(
@@ -733,7 +753,7 @@ class SSMSunTimeSensor(SensorEntity):
             self._attr_extra_state_attributes["i_shade_direct_sun"] = None
             self._attr_extra_state_attributes["i_shade_partial"] = None
             self._attr_extra_state_attributes["i_shade_full"] = None
-            return False
+            return None
         except Exception as error:
             _LOGGER.exception(
                 "Unexpected error calling Sun Time API (/calculatewithindex): %s",
@@ -742,19 +762,151 @@ class SSMSunTimeSensor(SensorEntity):
             self._attr_extra_state_attributes["i_shade_direct_sun"] = None
             self._attr_extra_state_attributes["i_shade_partial"] = None
             self._attr_extra_state_attributes["i_shade_full"] = None
-            return False
+            return None
 
     async def async_update(self) -> None:
         """Get the latest data from the API and update the state."""
+        with trace_update(self._traces, self.entity_id):
+            await self._async_update_state()
+
+    async def _async_update_state(self) -> None:
+        """Calculate the sun-time values and choose the state."""
         now = datetime.now(STOCKHOLM_TIMEZONE)
 
-        location_updated = await self._update_from_location_calculation(now)
-        index_updated = await self._update_from_index_calculation(
-            prefer_as_state=not location_updated
+        location_direct_sun, index_direct_sun = await asyncio.gather(
+            self._update_from_location_calculation(now),
+            self._update_from_index_calculation(now),
         )
 
-        self._attr_available = location_updated or index_updated
+        if location_direct_sun is not None:
+            # Main state is location/date/hour based direct-sun safe time.
+            self._attr_native_value = location_direct_sun
+            record_branch("location")
+        elif index_direct_sun is not None:
+            # Fallback mode: no official sun-time coordinates exist.
+            # Use current-UV-index safe time as the entity state.
+            self._attr_native_value = index_direct_sun
+            record_branch("index_fallback")
+
+        self._attr_available = (
+            location_direct_sun is not None or index_direct_sun is not None
+        )
 
         if not self._attr_available:
+            record_branch("unavailable")
             self._attr_native_value = None
             self._attr_extra_state_attributes["last_updated"] = _last_updated_iso()
+            return
+
+        self._last_inputs = self._current_inputs(now)
+        self._cache.set(
+            self._cache_key,
+            {
+                "native_value": self._attr_native_value,
+                "attributes": dict(self._attr_extra_state_attributes),
+            },
+        )
+
+
+class SSMSunTimeSensor(SSMSunTimeSensorBase[SSMUVIndexCoordinator]):
+    """Representation of a SSM Min Soltid Sensor."""
+
+    def _uv_data(self) -> UVIndexData | None:
+        """Return the shared UV forecast for the location."""
+        return self._uv_coordinator.data
+
+
+class SSMNetworkSunTimeSensor(SSMSunTimeSensorBase[SSMUVIndexNetworkCoordinator]):
+    """Representation of the Min Soltid Sensor for one catalog location."""
+
+    def __init__(
+        self,
+        cache: SSMCache,
+        index_table: SSMSunTimeIndexTable,
+        location_table: SSMSunTimeLocationTable,
+        traces: TraceBuffer,
+        name: str,
+        skin_type: str,
+        uv_coordinator: SSMUVIndexNetworkCoordinator,
+        location: str,
+        location_name: str,
+        entry_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            cache=cache,
+            index_table=index_table,
+            location_table=location_table,
+            traces=traces,
+            name=name,
+            skin_type=skin_type,
+            uv_coordinator=uv_coordinator,
+            location=location,
+            entry_id=entry_id,
+        )
+
+        self._attr_name = f"Min soltid {location_name}"
+        self._attr_unique_id = f"{entry_id}_sun_time_{location}"
+
+    def _uv_data(self) -> UVIndexData | None:
+        """Return the location forecast from the network results."""
+        results = self._uv_coordinator.data
+        result = results.get(self._location) if results is not None else None
+        return result.data if result is not None else None
+
+
+class SSMRequestQueueSensor(SensorEntity):
+    """Representation of the integration-wide SSM request queue."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:tray-full"
+    _attr_translation_key = "request_queue"
+
+    def __init__(self, limiter: RequestLimiter) -> None:
+        """Initialize the sensor."""
+        self._limiter = limiter
+
+        self._attr_name = "Request queue"
+        self._attr_unique_id = f"{DOMAIN}_request_queue"
+        self._attr_native_value: int | None = None
+        self._attr_device_info = service_device_info()
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+
+    async def async_update(self) -> None:
+        """Read the current queue statistics."""
+        stats = self._limiter.stats
+        self._attr_native_value = stats.pop("queue_depth")
+        self._attr_extra_state_attributes = stats
+
+
+class SSMEndpointMetricsSensor(SensorEntity):
+    """Representation of the request metrics of one SSM API endpoint."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-outline"
+    _attr_translation_key = "endpoint_metrics"
+    _unrecorded_attributes = frozenset({"statuses", "latency_buckets", "strategies"})
+
+    def __init__(self, client: SSMApiClient, endpoint: str) -> None:
+        """Initialize the sensor."""
+        self._client = client
+        self._endpoint = endpoint
+
+        self._attr_name = f"{ENDPOINT_NAMES[endpoint]} latency"
+        self._attr_unique_id = f"{DOMAIN}_endpoint_metrics_{endpoint}"
+        self._attr_native_value: int | None = None
+        self._attr_device_info = service_device_info()
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+
+    async def async_update(self) -> None:
+        """Read the current endpoint metrics."""
+        metrics = self._client.endpoint_metrics(self._endpoint).as_dict()
+        self._attr_native_value = metrics.pop("p95_latency")
+        self._attr_extra_state_attributes = metrics
@@ -0,0 +1,51 @@
+"""Services for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401, R0903
+
+from __future__ import annotations
+
+import voluptuous as vol  # type: ignore
+from homeassistant.core import HomeAssistant, ServiceCall, callback  # type: ignore
+from homeassistant.helpers import config_validation as cv  # type: ignore
+from homeassistant.util import dt as dt_util  # type: ignore
+
+from .const import (
+    CONF_END,
+    CONF_START,
+    CONF_STATION,
+    DOMAIN,
+    SERVICE_BACKFILL_RADIATION,
+    STATIONS,
+)
+from .coordinator import async_get_coordinators
+
+BACKFILL_RADIATION_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_STATION): vol.In([station["id"] for station in STATIONS]),
+        vol.Required(CONF_START): cv.datetime,
+        vol.Optional(CONF_END): cv.datetime,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_backfill_radiation(call: ServiceCall) -> None:
+        """Backfill a station's radiation history into long-term statistics."""
+        start = dt_util.as_utc(call.data[CONF_START])
+        end = dt_util.as_utc(call.data.get(CONF_END) or dt_util.utcnow())
+
+        await async_get_coordinators(hass).backfill.async_backfill(
+            call.data[CONF_STATION],
+            int(start.timestamp() * 1000),
+            int(end.timestamp() * 1000),
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL_RADIATION,
+        async_backfill_radiation,
+        schema=BACKFILL_RADIATION_SCHEMA,
+    )
@@ -0,0 +1,125 @@
+"""Long-term statistics import for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401, R0903
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime
+
+from homeassistant.components.recorder import get_instance  # type: ignore
+from homeassistant.components.recorder.models import (  # type: ignore
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (  # type: ignore
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant  # type: ignore
+
+from .const import DOMAIN, STATIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+_HOUR_MS = 3_600_000
+
+
+class RadiationStatisticsImporter:
+    """Write hourly radiation statistics for a station to the recorder.
+
+    Every fetched sample ends up in an hourly mean, minimum and maximum in
+    nSv/h, imported in one batch per fetch. Hours before the last imported
+    hour are skipped; the last hour is imported again because it may have
+    been incomplete. Callers pass every known sample of the hours they
+    import, as an hour is replaced by the statistics of the samples given.
+    """
+
+    def __init__(self, hass: HomeAssistant, station: str) -> None:
+        """Initialize the importer."""
+        self._hass = hass
+        self.statistic_id = f"{DOMAIN}:radiation_{station}"
+        station_name = next(
+            (item["name"] for item in STATIONS if item["id"] == station), station
+        )
+        self._metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            mean_type=StatisticMeanType.ARITHMETIC,
+            name=f"Radiation level {station_name}",
+            source=DOMAIN,
+            statistic_id=self.statistic_id,
+            unit_class=None,
+            unit_of_measurement="nSv/h",
+        )
+        self._last_hour: int | None = None
+        self._loaded = False
+
+    async def _async_load_last_hour(self) -> None:
+        """Read the start of the newest imported hour from the recorder."""
+        self._loaded = True
+
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, self.statistic_id, True, set()
+        )
+        rows = last.get(self.statistic_id)
+        if rows:
+            self._last_hour = int(rows[0]["start"] * 1000)
+
+    @staticmethod
+    def hourly_statistics(
+        samples: list[tuple[int, float]],
+    ) -> list[tuple[int, StatisticData]]:
+        """Return (hour start in Unix milliseconds, statistics) per hour."""
+        hours: dict[int, list[float]] = {}
+        for timestamp, value in samples:
+            hours.setdefault(timestamp - timestamp % _HOUR_MS, []).append(value * 1000)
+
+        return [
+            (
+                hour,
+                StatisticData(
+                    start=datetime.fromtimestamp(hour / 1000, UTC),
+                    mean=sum(values) / len(values),
+                    min=min(values),
+                    max=max(values),
+                ),
+            )
+            for hour, values in sorted(hours.items())
+        ]
+
+    async def async_import(
+        self,
+        samples: list[tuple[int, float]],
+        skip_imported: bool = True,
+    ) -> int:
+        """Import (Unix milliseconds, μSv/h) samples and return the hour count."""
+        if "recorder" not in self._hass.config.components or not samples:
+            return 0
+
+        if not self._loaded:
+            await self._async_load_last_hour()
+
+        statistics = [
+            (hour, data)
+            for hour, data in self.hourly_statistics(samples)
+            if not skip_imported or self._last_hour is None or hour >= self._last_hour
+        ]
+        if not statistics:
+            return 0
+
+        async_add_external_statistics(
+            self._hass, self._metadata, [data for _hour, data in statistics]
+        )
+
+        newest = statistics[-1][0]
+        if self._last_hour is None or newest > self._last_hour:
+            self._last_hour = newest
+
+        _LOGGER.debug(
+            "Imported %s hours of radiation statistics into %s",
+            len(statistics),
+            self.statistic_id,
+        )
+        return len(statistics)
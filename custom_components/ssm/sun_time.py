@@ -0,0 +1,280 @@
+"""Sun-time lookups for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=C0301, E0401, R0903, R0913, R0917, W0718
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date
+
+from aiohttp import ClientError  # type: ignore
+from homeassistant.core import HomeAssistant, callback  # type: ignore
+
+from .api import (
+    ENDPOINT_SUN_TIME,
+    ENDPOINT_SUN_TIME_INDEX,
+    SafeTimes,
+    SSMApiClient,
+    parse_safe_times,
+)
+from .cache import SSMCache
+from .const import (
+    CACHE_TTL_SUN_TIME_INDEX,
+    CACHE_TTL_SUN_TIME_LOCATION,
+    SUN_TIME_CALCULATE_URL,
+    SUN_TIME_CALCULATE_WITH_INDEX_URL,
+    SUN_TIME_MAX_UV_INDEX,
+    SUN_TIME_PREFILL_CONCURRENCY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SSMSunTimeIndexTable:
+    """Persisted /calculatewithindex results keyed by skin type and UV index.
+
+    The API input space is small (six skin types and a UV index of roughly
+    0-15), so results are kept for a long time and shared by every sensor.
+    """
+
+    def __init__(self, client: SSMApiClient, cache: SSMCache) -> None:
+        """Initialize the table."""
+        self._client = client
+        self._cache = cache
+        self._prefilled: set[int] = set()
+
+    @staticmethod
+    def _cache_key(skin_type: int, uv_index: int) -> str:
+        """Return the cache key for a table cell."""
+        return f"sun_time_index/{skin_type}/{uv_index}"
+
+    @callback
+    def get_cached(self, skin_type: int, uv_index: int) -> SafeTimes | None:
+        """Return a cached table cell without calling the API."""
+        return self._cache.get(
+            self._cache_key(skin_type, uv_index), CACHE_TTL_SUN_TIME_INDEX
+        )
+
+    async def async_get(self, skin_type: int, uv_index: int) -> SafeTimes | None:
+        """Return safe times for a skin type and UV index, fetching if needed."""
+        metrics = self._client.endpoint_metrics(ENDPOINT_SUN_TIME_INDEX)
+        safe_times = self.get_cached(skin_type, uv_index)
+        if safe_times is not None:
+            metrics.cache_hits += 1
+            return safe_times
+
+        metrics.cache_misses += 1
+
+        payload = {
+            "skintypeId": skin_type,
+            "uvIndex": uv_index,
+        }
+
+        _LOGGER.debug(
+            "Sending request to Sun Time API (/calculatewithindex): %s",
+            payload,
+        )
+
+        response = await self._client.async_post(
+            SUN_TIME_CALCULATE_WITH_INDEX_URL, payload
+        )
+
+        if response.status != 200:
+            _LOGGER.warning(
+                "Failed to fetch Sun Time API (/calculatewithindex) response: %s",
+                response.status,
+            )
+            return None
+
+        data = response.data
+        _LOGGER.debug(
+            "Received response from Sun Time API (/calculatewithindex): %s",
+            data,
+        )
+
+        safe_times = parse_safe_times(data.get("result", {}).get("safeTimeResults", []))
+
+        if safe_times.get("direkt solljus") is None:
+            _LOGGER.warning(
+                "Index-based Sun Time API response did not contain "
+                "direct-sun safe time: %s",
+                data,
+            )
+            return None
+
+        self._cache.set(self._cache_key(skin_type, uv_index), safe_times)
+        return safe_times
+
+    async def async_prefill(self, skin_type: int) -> None:
+        """Fill every UV index cell for a skin type that is not cached yet."""
+        if skin_type in self._prefilled:
+            return
+
+        self._prefilled.add(skin_type)
+        semaphore = asyncio.Semaphore(SUN_TIME_PREFILL_CONCURRENCY)
+
+        async def fill(uv_index: int) -> None:
+            async with semaphore:
+                try:
+                    await self.async_get(skin_type, uv_index)
+                except (
+                    ClientError,
+                    TimeoutError,
+                    ValueError,
+                    KeyError,
+                    TypeError,
+                ) as error:
+                    _LOGGER.debug(
+                        "Could not prefill sun time for skin type %s, UV index %s: %s",
+                        skin_type,
+                        uv_index,
+                        error,
+                    )
+
+        await asyncio.gather(
+            *(fill(uv_index) for uv_index in range(SUN_TIME_MAX_UV_INDEX + 1))
+        )
+
+
+class SSMSunTimeLocationTable:
+    """Persisted /calculate results for every hour of a day.
+
+    The first lookup for a skin type, location and date fetches all hours
+    with bounded concurrency; later lookups that day are local.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SSMApiClient,
+        cache: SSMCache,
+    ) -> None:
+        """Initialize the table."""
+        self._hass = hass
+        self._client = client
+        self._cache = cache
+        self._pending: dict[str, asyncio.Task[list[SafeTimes | None]]] = {}
+
+    @staticmethod
+    def _cache_key(skin_type: int, latitude: float, longitude: float, day: date) -> str:
+        """Return the cache key for a day of results."""
+        return f"sun_time_location/{skin_type}/{latitude}/{longitude}/{day.isoformat()}"
+
+    async def async_get_day(
+        self,
+        skin_type: int,
+        latitude: float,
+        longitude: float,
+        day: date,
+    ) -> list[SafeTimes | None]:
+        """Return safe times for each hour of a day, fetching missing hours.
+
+        Hours that could not be fetched are None and are retried on the next
+        lookup.
+        """
+        key = self._cache_key(skin_type, latitude, longitude, day)
+        hours: list[SafeTimes | None] | None = self._cache.get(
+            key, CACHE_TTL_SUN_TIME_LOCATION
+        )
+
+        metrics = self._client.endpoint_metrics(ENDPOINT_SUN_TIME)
+        if hours is not None and all(hour is not None for hour in hours):
+            metrics.cache_hits += 1
+            return hours
+
+        metrics.cache_misses += 1
+
+        task = self._pending.get(key)
+        if task is None:
+            task = self._hass.async_create_task(
+                self._async_fetch_day(
+                    key, skin_type, latitude, longitude, day, hours or [None] * 24
+                )
+            )
+            self._pending[key] = task
+            task.add_done_callback(lambda _task: self._pending.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _async_fetch_day(
+        self,
+        key: str,
+        skin_type: int,
+        latitude: float,
+        longitude: float,
+        day: date,
+        hours: list[SafeTimes | None],
+    ) -> list[SafeTimes | None]:
+        """Fetch every missing hour of a day and cache the result."""
+        hours = list(hours)
+        semaphore = asyncio.Semaphore(SUN_TIME_PREFILL_CONCURRENCY)
+
+        async def fetch(hour: int) -> None:
+            async with semaphore:
+                try:
+                    hours[hour] = await self._async_fetch_hour(
+                        skin_type, latitude, longitude, day, hour
+                    )
+                except (
+                    ClientError,
+                    TimeoutError,
+                    ValueError,
+                    KeyError,
+                    TypeError,
+                ) as error:
+                    _LOGGER.warning(
+                        "Error calling Sun Time API (/calculate) for hour %s: %s",
+                        hour,
+                        error,
+                    )
+
+        await asyncio.gather(
+            *(
+                fetch(hour)
+                for hour, safe_times in enumerate(hours)
+                if safe_times is None
+            )
+        )
+
+        if any(safe_times is not None for safe_times in hours):
+            self._cache.set(key, hours)
+            self._cache.remove_older(key.rsplit("/", 1)[0] + "/", key)
+
+        return hours
+
+    async def _async_fetch_hour(
+        self,
+        skin_type: int,
+        latitude: float,
+        longitude: float,
+        day: date,
+        hour: int,
+    ) -> SafeTimes | None:
+        """Fetch safe times for one hour of a day."""
+        payload = {
+            "skintypeId": skin_type,
+            "latitude": latitude,
+            "longitude": longitude,
+            "dateStr": day.isoformat(),
+            "hour": hour,
+        }
+
+        _LOGGER.debug("Sending request to Sun Time API (/calculate): %s", payload)
+
+        response = await self._client.async_post(SUN_TIME_CALCULATE_URL, payload)
+
+        if response.status != 200:
+            _LOGGER.warning(
+                "Failed to fetch Sun Time API (/calculate) response: %s",
+                response.status,
+            )
+            return None
+
+        data = response.data
+        _LOGGER.debug(
+            "Received response from Sun Time API (/calculate): %s",
+            data,
+        )
+
+        return parse_safe_times(data.get("result", {}).get("safeTimeResults", []))
@@ -0,0 +1,74 @@
+"""Update tracing for the Swedish Radiation Safety Authority integration."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from .const import DIAGNOSTICS_TRACE_LIMIT
+
+_CURRENT_TRACE: ContextVar[UpdateTrace | None] = ContextVar(
+    "ssm_update_trace", default=None
+)
+
+
+@dataclass(slots=True)
+class UpdateTrace:
+    """The requests made and the branch taken by one update."""
+
+    source: str
+    started: str
+    duration: int | None = None
+    branch: str | None = None
+    error: str | None = None
+    requests: list[dict[str, Any]] = field(default_factory=list)
+
+
+TraceBuffer = deque[UpdateTrace]
+
+
+def trace_buffer() -> TraceBuffer:
+    """Return an empty ring buffer of the most recent update traces."""
+    return deque(maxlen=DIAGNOSTICS_TRACE_LIMIT)
+
+
+@contextmanager
+def trace_update(buffer: TraceBuffer, source: str) -> Iterator[UpdateTrace]:
+    """Trace the requests made in the block, then add the trace to a buffer.
+
+    The trace is held in a context variable, so requests made by tasks
+    started inside the block are recorded as well.
+    """
+    trace = UpdateTrace(source=source, started=datetime.now(UTC).isoformat())
+    token = _CURRENT_TRACE.set(trace)
+    started = time.monotonic()
+
+    try:
+        yield trace
+    except BaseException as error:
+        trace.error = f"{type(error).__name__}: {error}"
+        raise
+    finally:
+        trace.duration = round((time.monotonic() - started) * 1000)
+        _CURRENT_TRACE.reset(token)
+        buffer.append(trace)
+
+
+def record_request(**details: Any) -> None:
+    """Add a request to the trace of the running update, if any."""
+    trace = _CURRENT_TRACE.get()
+    if trace is not None:
+        trace.requests.append(details)
+
+
+def record_branch(branch: str) -> None:
+    """Record the branch taken by the running update, if traced."""
+    trace = _CURRENT_TRACE.get()
+    if trace is not None:
+        trace.branch = branch
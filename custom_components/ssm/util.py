@@ -0,0 +1,33 @@
+"""Helpers for the Swedish Radiation Safety Authority integration."""
+
+# pylint: disable=R0911
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def to_number(value: Any) -> int | float | None:
+    """Convert a value to int or float if possible."""
+    if value is None or isinstance(value, bool):
+        return None
+
+    if isinstance(value, (int, float)):
+        return value
+
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+
+        if number.is_integer():
+            return int(number)
+
+        return number
+
+    return None
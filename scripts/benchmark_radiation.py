@@ -0,0 +1,184 @@
+"""Micro-benchmarks for parsing and aggregating SSM API payloads.
+
+Measures time and memory allocated per call for the per-update work on one
+API payload: parsing the radiation samples and aggregating the sensor
+window, and parsing the UV index forecast. Each is compared with the
+previous sensor implementation, which built an intermediate list of raw
+radiation values and a second list of converted values before aggregating,
+and converted each hourly UV value while building the attributes. The
+radiation payload is parsed into an empty history, which is what the
+coordinator does on its first update; later updates parse only the samples
+newer than the history.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m scripts.benchmark_radiation
+"""
+
+# pylint: disable=E0401
+
+from __future__ import annotations
+
+import math
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from custom_components.ssm.api import parse_radiation_samples, parse_uv_index
+from custom_components.ssm.const import RADIATION_HISTORY_CAPACITY
+from custom_components.ssm.ring_buffer import SampleRingBuffer, WindowStats
+from custom_components.ssm.util import to_number
+
+_INTERVAL_MS = 300_000
+_HOUR_MS = 3_600_000
+_WINDOW_HOURS = 3
+
+
+def _previous_radiation(values: list[Any]) -> tuple[float, float, float, float]:
+    """Return the window aggregates the way the previous sensor did."""
+    radiation_values = [
+        item[1] for item in values if isinstance(item, (list, tuple)) and len(item) > 1
+    ]
+    valid_values = [
+        float(value)
+        for value in (to_number(value) for value in radiation_values)
+        if value is not None
+    ]
+    return (
+        valid_values[-1],
+        min(valid_values),
+        max(valid_values),
+        sum(valid_values) / len(valid_values),
+    )
+
+
+def _radiation(values: list[Any], start: int, end: int) -> WindowStats | None:
+    """Return the window aggregates the way the coordinator does."""
+    history = SampleRingBuffer(RADIATION_HISTORY_CAPACITY)
+    history.extend(parse_radiation_samples(values))
+    return history.window(start, end)
+
+
+def _previous_uv_index(data: dict[str, Any], current_hour: int) -> dict[str, Any]:
+    """Return the UV index attributes the way the previous sensor did."""
+    dates = data["response"]["location"]["date"]
+    today_data = dates[0]
+    hourly_data = today_data["hourlyUvIndex"]
+
+    current_uv = to_number(hourly_data[current_hour])
+    max_uv_today = to_number(today_data["maxUvIndex"])
+
+    max_uv_time = today_data.get("maxUvIndexTime")
+    max_time_formatted: str | None = None
+    if max_uv_time:
+        max_time_obj = datetime.strptime(max_uv_time, "%Y-%m-%dT%H:%M:%S")
+        max_time_formatted = max_time_obj.strftime("%H:%M")
+
+    max_uv_tomorrow: int | float | None = None
+    if len(dates) > 1:
+        max_uv_tomorrow = to_number(dates[1].get("maxUvIndex"))
+
+    hourly_forecast = [
+        {
+            "time": f"{hour:02d}:00",
+            "uv_index": to_number(uv),
+        }
+        for hour, uv in enumerate(hourly_data)
+    ]
+
+    return {
+        "current_uv": current_uv,
+        "max_uv_today": max_uv_today,
+        "max_uv_time": max_time_formatted,
+        "max_uv_tomorrow": max_uv_tomorrow,
+        "hourly_forecast": hourly_forecast,
+        "last_updated": datetime.now(UTC).isoformat(),
+    }
+
+
+def _uv_index_payload() -> dict[str, Any]:
+    """Return a UV index API response for today and tomorrow."""
+    hourly = [round(max(0.0, 6 - abs(hour - 13) * 0.8), 1) for hour in range(24)]
+    return {
+        "response": {
+            "location": {
+                "date": [
+                    {
+                        "hourlyUvIndex": hourly,
+                        "maxUvIndex": max(hourly),
+                        "maxUvIndexTime": "2024-06-21T13:00:00",
+                    },
+                    {
+                        "hourlyUvIndex": hourly,
+                        "maxUvIndex": max(hourly),
+                        "maxUvIndexTime": "2024-06-22T13:00:00",
+                    },
+                ]
+            }
+        }
+    }
+
+
+def _allocated(function: Callable[[], Any], keep: int = 50) -> tuple[int, int]:
+    """Return the peak and the retained memory allocated per call, in bytes.
+
+    Results are kept alive for the retained size, which is what a caller
+    holding on to them pays, e.g. the data kept by a coordinator. Keeping
+    many of them also defeats the interpreter's free lists, which would
+    otherwise hide reused tuples and numbers from tracemalloc.
+    """
+    tracemalloc.start()
+    function()
+    _current, peak = tracemalloc.get_traced_memory()
+    results = [function() for _ in range(keep)]
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return peak, retained // keep
+
+
+def _report(name: str, function: Callable[[], Any]) -> None:
+    """Print the time and allocations per call."""
+    number = 2_000
+    seconds = min(timeit.repeat(function, number=number, repeat=5)) / number
+    peak, retained = _allocated(function)
+    print(f"{name:<34} {seconds * 1_000_000:>9.1f} µs {peak:>9} B {retained:>9} B")
+
+
+def main() -> None:
+    """Run the benchmarks on one radiation window and one UV forecast."""
+    end = 1_718_971_200_000
+    start = end - _WINDOW_HOURS * _HOUR_MS
+    # The API includes the samples at both ends of the window.
+    values: list[Any] = [
+        [timestamp, 0.1 + (index % 17) / 1000]
+        for index, timestamp in enumerate(range(start, end + 1, _INTERVAL_MS))
+    ]
+
+    expected = _previous_radiation(values)
+    actual = _radiation(values, start, end)
+    assert actual is not None
+    assert (actual.latest, actual.minimum, actual.maximum) == expected[:3]
+    assert math.isclose(actual.mean, expected[3])
+
+    hour = 13
+    uv_data = _uv_index_payload()
+    previous = _previous_uv_index(uv_data, hour)
+    forecast = parse_uv_index(uv_data, "2024-06-21")
+    assert forecast.uv_index_at(hour) == previous["current_uv"]
+    assert list(forecast.hourly_forecast) == previous["hourly_forecast"]
+    assert forecast.max_uv_today == previous["max_uv_today"]
+    assert forecast.max_uv_time == previous["max_uv_time"]
+    assert forecast.max_uv_tomorrow == previous["max_uv_tomorrow"]
+
+    print(f"{'benchmark':<34} {'time':>12} {'peak':>11} {'retained':>11}")
+    _report("radiation, value lists (previous)", lambda: _previous_radiation(values))
+    _report("radiation, parse and ring window", lambda: _radiation(values, start, end))
+    _report("UV index, sensor (previous)", lambda: _previous_uv_index(uv_data, hour))
+    _report("UV index, parse_uv_index", lambda: parse_uv_index(uv_data, "2024-06-21"))
+
+
+if __name__ == "__main__":
+    main()